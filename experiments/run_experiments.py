@@ -4,8 +4,10 @@ Behavior:
 - Generates 25 random instances using src.core.generator.generate_instance (max 30 jobs, 9 machines, 10 resources).
 - Loads 5 fixed instances from data/sample.json (takes first 5 keys present there).
 - For each instance runs each solver 10 times with different seeds.
-- Applies a timeout per solver run (default 300s).
-- Records: instance_id, solver, run_id, seed, makespan, runtime, status.
+- Gives each solver a time budget (TIMEOUT - TIME_LIMIT_MARGIN) after which it returns its
+  best-so-far schedule; the subprocess is only killed at TIMEOUT, and even then the last
+  incumbent it reported is recorded (status 'timeout').
+- Records: instance_id, solver, run_id, seed, makespan, lower_bound, gap, runtime, status.
 - Writes results to experiments/results.csv
 
 This script imports solvers as Python modules. It expects the solvers to expose a function `solve_instance(data, seed, timeout)` that returns a dict with keys {"makespan", "runtime", "status"}.
@@ -42,10 +44,16 @@ RANDOM_MAX_MACHINES = 3
 RANDOM_MAX_RESOURCES = 2
 RUNS_PER_INSTANCE = 1
 TIMEOUT = 600  # seconds per run
+TIME_LIMIT_MARGIN = 10  # seconds left to the solver to return its incumbent before the kill
 
 # Solvers to test: map logical name -> (importable module under src.solvers, SolverClassName)
 SOLVERS = {
     'bruteforce': ('src.solvers.bruteforce', 'BruteForceSolver'),
+    'branch_and_bound': ('src.solvers.branch_and_bound', 'BranchAndBoundSolver'),
+    'subset_dp': ('src.solvers.subset_dp', 'SubsetDPSolver'),
+    'milp': ('src.solvers.milp', 'MILPSolver'),
+    'lns': ('src.solvers.lns', 'LNSSolver'),
+    'beam_search': ('src.solvers.beam_search', 'BeamSearchSolver'),
     'earliest_start': ('src.solvers.earliest_start_solver', 'EarliestStartSolver'),
     'genetic': ('src.solvers.metaheuristic', 'GeneticSolver'),
     #'greedy': ('src.solvers.greedy', 'GreedySolver'),
@@ -90,7 +98,8 @@ def _run_solver_via_module(module_path: str, instance_data: Dict[str, Any], clas
             tmp_path = Path(tf.name)
 
         runner = Path(__file__).resolve().parent / 'solver_runner.py'
-        cmd = [sys.executable, str(runner), module_path, str(tmp_path), class_name, str(seed)]
+        time_limit = max(1, timeout - TIME_LIMIT_MARGIN)
+        cmd = [sys.executable, str(runner), module_path, str(tmp_path), class_name, str(seed), str(time_limit)]
         start = time.time()
         env = os.environ.copy()
         # ensure subprocess can import local package 'src'
@@ -103,15 +112,21 @@ def _run_solver_via_module(module_path: str, instance_data: Dict[str, Any], clas
             try:
                 parsed = json.loads(out.decode()) if out else {}
                 # merge stderr into parsed error if present
-                if err and not parsed.get('error'):
-                    parsed['stderr'] = err.decode()
+                stderr = _strip_incumbents(err.decode()) if err else ''
+                if stderr and not parsed.get('error'):
+                    parsed['stderr'] = stderr
                 parsed.setdefault('runtime', runtime)
                 return parsed
             except Exception:
                 return {'status': 'error', 'makespan': None, 'runtime': runtime, 'error': err.decode(), 'stdout': out.decode()}
         except subprocess.TimeoutExpired:
             p.kill()
-            return {'status': 'timeout', 'makespan': None, 'runtime': timeout}
+            # Keep the best schedule the solver reported before it was killed
+            _, err = p.communicate()
+            incumbent = _last_incumbent(err.decode()) if err else None
+            return {'status': 'timeout', 'makespan': incumbent.get('makespan') if incumbent else None,
+                    'lower_bound': incumbent.get('lower_bound') if incumbent else None,
+                    'gap': incumbent.get('gap') if incumbent else None, 'runtime': timeout}
         finally:
             try:
                 tmp_path.unlink()
@@ -121,10 +136,26 @@ def _run_solver_via_module(module_path: str, instance_data: Dict[str, Any], clas
         return {'status': 'error', 'makespan': None, 'runtime': 0, 'error': str(e)}
 
 
+def _last_incumbent(stderr: str):
+    """Last incumbent line written by solver_runner ('INCUMBENT {json}')."""
+    last = None
+    for line in stderr.splitlines():
+        if line.startswith('INCUMBENT '):
+            try:
+                last = json.loads(line[len('INCUMBENT '):])
+            except ValueError:
+                pass
+    return last
+
+
+def _strip_incumbents(stderr: str) -> str:
+    return '\n'.join(line for line in stderr.splitlines() if not line.startswith('INCUMBENT ')).strip()
+
+
 def main():
     # prepare results file
     RESULTS_CSV.parent.mkdir(parents=True, exist_ok=True)
-    fieldnames = ['instance_id', 'solver', 'run_id', 'seed', 'makespan', 'runtime', 'status', 'error']
+    fieldnames = ['instance_id', 'solver', 'run_id', 'seed', 'makespan', 'lower_bound', 'gap', 'runtime', 'status', 'error']
     with open(RESULTS_CSV, 'w', newline='') as csvf:
         writer = csv.DictWriter(csvf, fieldnames=fieldnames)
         writer.writeheader()
@@ -205,6 +236,8 @@ def main():
                     'run_id': run_id,
                     'seed': seed,
                     'makespan': res.get('makespan'),
+                    'lower_bound': res.get('lower_bound'),
+                    'gap': res.get('gap'),
                     'runtime': res.get('runtime'),
                     'status': res.get('status'),
                     'error': res.get('error') or res.get('stderr') or None
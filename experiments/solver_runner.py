@@ -1,8 +1,11 @@
 #!/usr/bin/env python3
 """Helper runner invoked by experiments/run_experiments.py.
-Usage: solver_runner.py <module_path> <instance_json> <class_name> <seed>
+Usage: solver_runner.py <module_path> <instance_json> <class_name> <seed> [time_limit]
 If <class_name> is empty string, the runner will pick the first class name containing 'Solver'.
-Outputs a single JSON line with keys: status, makespan, runtime, error (optional), log (captured stdout/stderr from solver).
+With a time_limit (seconds) the solver returns its best-so-far schedule when the budget runs out.
+Every new incumbent is also written to the real stderr as 'INCUMBENT {json}', so the caller
+can still record it if the process has to be killed.
+Outputs a single JSON line with keys: status, makespan, lower_bound, gap, runtime, error (optional), log (captured stdout/stderr from solver).
 """
 import sys
 import json
@@ -21,21 +24,6 @@ if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
 
-def build_problem_from_data(data):
-    # Import here to ensure correct PYTHONPATH
-    from src.core.model import ProblemInstance, Job
-    num_machines = data.get('num_machines')
-    resources = data.get('resources', {})
-    jobs_raw = data.get('jobs', [])
-    jobs = []
-    for j in jobs_raw:
-        jid = j.get('id')
-        dur = j.get('duration')
-        req = j.get('requirements', {})
-        jobs.append(Job(id=jid, duration=dur, resource_requirements=req))
-    return ProblemInstance(num_machines=num_machines, resources=resources, jobs=jobs)
-
-
 def main():
     if len(sys.argv) < 4:
         print(json.dumps({'status': 'error', 'error': 'Usage: solver_runner.py <module_path> <instance_json> <class_name> <seed>'}))
@@ -44,6 +32,7 @@ def main():
     instance_file = sys.argv[2]
     class_name = sys.argv[3]
     seed = int(sys.argv[4]) if len(sys.argv) > 4 else None
+    time_limit = float(sys.argv[5]) if len(sys.argv) > 5 else None
 
     random.seed(seed)
 
@@ -69,7 +58,8 @@ def main():
     # Determine class name
     if not class_name:
         # pick first attribute with 'Solver' in name
-        candidates = [name for name in dir(mod) if 'Solver' in name]
+        # (skipping the shared base class that every solver module imports)
+        candidates = [name for name in dir(mod) if 'Solver' in name and name != 'Solver']
         if not candidates:
             print(json.dumps({'status': 'error', 'error': f'No Solver class found in {module_path}'}))
             sys.exit(1)
@@ -82,20 +72,32 @@ def main():
     SolverClass = getattr(mod, class_name)
 
     try:
-        problem = build_problem_from_data(data)
+        # Import here to ensure correct PYTHONPATH
+        from src.core.loader import load_problem
+        problem = load_problem(data)
     except Exception as e:
         print(json.dumps({'status': 'error', 'error': f'Cannot build ProblemInstance: {e}'}))
         sys.exit(1)
 
+    def report_incumbent(sol, elapsed):
+        # Bypasses the capture below: the parent reads this even after a kill
+        sys.__stderr__.write('INCUMBENT ' + json.dumps({'makespan': sol.makespan, 'lower_bound': sol.lower_bound,
+                                                        'gap': sol.gap, 'elapsed': elapsed}) + '\n')
+        sys.__stderr__.flush()
+
+    controls = {'time_limit': time_limit, 'on_improvement': report_incumbent}
     try:
-        solver = SolverClass(problem)
+        solver = SolverClass(problem, **controls)
     except TypeError:
-        # try with different constructor signature (max_combinations for brute force)
+        # try with different constructor signature (max_combinations for brute force, no run controls)
         try:
-            solver = SolverClass(problem, max_combinations=1000000)
-        except Exception as e:
-            print(json.dumps({'status': 'error', 'error': f'Cannot instantiate solver class: {e}'}))
-            sys.exit(1)
+            solver = SolverClass(problem, max_combinations=1000000, **controls)
+        except TypeError:
+            try:
+                solver = SolverClass(problem)
+            except Exception as e:
+                print(json.dumps({'status': 'error', 'error': f'Cannot instantiate solver class: {e}'}))
+                sys.exit(1)
 
     start = time.time()
     try:
@@ -109,8 +111,12 @@ def main():
             makespan = getattr(sol, 'makespan', None)
         except Exception:
             makespan = None
+        lower_bound = getattr(sol, 'lower_bound', None)
+        gap = getattr(sol, 'gap', None)
+        stop_reason = getattr(solver, 'stop_reason', None)
         log = buf.getvalue()
-        print(json.dumps({'status': 'ok', 'makespan': makespan, 'runtime': runtime, 'log': log}))
+        print(json.dumps({'status': 'ok', 'makespan': makespan, 'lower_bound': lower_bound, 'gap': gap,
+                          'stop_reason': stop_reason, 'runtime': runtime, 'log': log}))
     except Exception as e:
         tb = traceback.format_exc()
         # include captured logs as well
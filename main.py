@@ -1,10 +1,11 @@
 from src.core.generator import generate_instance
-from src.core.model import Job, ProblemInstance
+from src.core.loader import load_problem
 from src.solvers.greedy import GreedySolver
 from src.solvers.metaheuristic import GeneticSolver
 from src.solvers.simulated_annealing import SimulatedAnnealingSolver
+from src.solvers.tabu_search import TabuSearchSolver
 from src.utils.advanced_visualizer import AdvancedVisualizer
-from src.solvers.bruteforce import BruteForceSolver
+from src.solvers.bruteforce import BruteForceSolver, count_schedules
 from src.solvers.earliest_start_solver import EarliestStartSolver
 
 def main():
@@ -34,11 +35,7 @@ def main():
     data = generate_instance(num_jobs=N_JOBS, num_machines=N_MACHINES, num_resources=N_RESOURCES)
     
     # Reconstruct objects
-    jobs = []
-    for j in data['jobs']:
-        jobs.append(Job(j['id'], j['duration'], {int(k): v for k, v in j['requirements'].items()}))
-    resources = {int(k): v for k, v in data['resources'].items()}
-    problem = ProblemInstance(data['num_machines'], resources, jobs)
+    problem = load_problem(data)
     
     # Solver Selection
     print("\nSelect Solver:")
@@ -67,9 +64,9 @@ def main():
         # Safety: compute number of combinations and ask confirmation for large runs
         n = len(problem.jobs)
         m = problem.num_machines
-        total = m ** n
+        total = count_schedules(n, m)
         if total > 1_000_000:
-            yn = input(f"Brute-force will evaluate {total} combinations. Continue? (y/N): ").lower()
+            yn = input(f"Brute-force will evaluate up to {total} schedules. Continue? (y/N): ").lower()
             if yn != 'y':
                 print("Operation cancelled by user.")
                 return
@@ -8,16 +8,8 @@ import csv
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.core.generator import generate_instance
-from src.core.model import Job, ProblemInstance
-from src.solvers.bruteforce import BruteForceSolver
-
-
-def build_problem_from_generated(data):
-    jobs = []
-    for j in data['jobs']:
-        jobs.append(Job(j['id'], j['duration'], {int(k): v for k, v in j['requirements'].items()}))
-    resources = {int(k): v for k, v in data['resources'].items()}
-    return ProblemInstance(data['num_machines'], resources, jobs)
+from src.core.loader import load_problem
+from src.solvers.bruteforce import BruteForceSolver, count_schedules
 
 
 def main():
@@ -25,7 +17,8 @@ def main():
     os.makedirs(out_dir, exist_ok=True)
     csv_path = os.path.join(out_dir, 'bruteforce_scaling.csv')
 
-    fieldnames = ['iteration', 'n_jobs', 'n_machines', 'n_resources', 'estimated_combinations', 'time_s', 'success', 'error', 'instance_file']
+    fieldnames = ['iteration', 'n_jobs', 'n_machines', 'n_resources', 'estimated_combinations', 'time_s',
+                  'evaluated', 'skipped', 'nodes', 'nodes_per_sec', 'workers', 'success', 'error', 'instance_file']
 
     with open(csv_path, 'w', newline='') as csvfile:
         writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
@@ -35,6 +28,7 @@ def main():
         # We'll grow number of jobs until brute force takes > 300s
         # Growth strategy: increase jobs by 1 each iteration, and set machines/resources proportional to jobs
         max_time_seconds = 300.0
+        workers = os.cpu_count() or 1
 
         n_jobs = 1
         while True:
@@ -54,19 +48,19 @@ def main():
                 json.dump(data, f, indent=4)
 
             # Build ProblemInstance
-            problem = build_problem_from_generated(data)
+            problem = load_problem(data)
 
-            # Estimate combinations
-            try:
-                estimated = problem.num_machines ** len(problem.jobs)
-            except OverflowError:
-                estimated = float('inf')
+            # Distinct schedules of the exhaustive search (before pruning)
+            estimated = count_schedules(len(problem.jobs), problem.num_machines)
 
             row = {'iteration': iteration, 'n_jobs': n_jobs, 'n_machines': n_machines, 'n_resources': n_resources,
-                   'estimated_combinations': estimated, 'time_s': None, 'success': False, 'error': '', 'instance_file': inst_file}
+                   'estimated_combinations': estimated, 'time_s': None, 'evaluated': None, 'skipped': None,
+                   'nodes': None, 'nodes_per_sec': None, 'workers': workers,
+                   'success': False, 'error': '', 'instance_file': inst_file}
 
             # Run brute force and time it
-            solver = BruteForceSolver(problem, max_combinations=None)
+            # Shards of the search run on all cores, sharing the incumbent
+            solver = BruteForceSolver(problem, max_combinations=None, workers=workers)
             print(f"Estimated brute-force combinations: {estimated}")
             t0 = time.time()
             try:
@@ -74,8 +68,13 @@ def main():
                 t1 = time.time()
                 elapsed = t1 - t0
                 row['time_s'] = round(elapsed, 4)
+                row['evaluated'] = solver.evaluated
+                row['skipped'] = solver.skipped
+                row['nodes'] = solver.nodes
+                row['nodes_per_sec'] = round(solver.nodes_per_sec)
                 row['success'] = True
-                print(f"Brute force finished in {elapsed:.2f}s, makespan={sol.makespan}")
+                print(f"Brute force finished in {elapsed:.2f}s, makespan={sol.makespan}, "
+                      f"{solver.nodes_per_sec:.0f} nodes/s on {workers} workers")
             except Exception as e:
                 t1 = time.time()
                 elapsed = t1 - t0
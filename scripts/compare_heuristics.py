@@ -29,7 +29,7 @@ if 'src' in sys.modules:
 import src
 print(f"Loaded src from: {src.__file__}")
 
-from src.core.model import ProblemInstance, Job
+from src.core.loader import load_problem
 from src.solvers.earliest_start_solver import EarliestStartSolver
 from src.solvers.metaheuristic import GeneticSolver
 
@@ -182,26 +182,9 @@ def generate_large_random(num_jobs: int, num_machines: int) -> Dict:
 # --- Runner ---
 
 
-def create_problem_instance(data: Dict) -> ProblemInstance:
-    jobs_data = data["jobs"]
-    job_objects = []
-    for j in jobs_data:
-        # data["jobs"] has "id", "duration", "requirements"
-        job_objects.append(Job(
-            id=j["id"],
-            duration=j["duration"],
-            resource_requirements=j["requirements"]
-        ))
-    
-    return ProblemInstance(
-        num_machines=data["num_machines"],
-        resources=data["resources"],
-        jobs=job_objects
-    )
-
 def solve_with_earliest_start(instance_data):
     try:
-        problem = create_problem_instance(instance_data)
+        problem = load_problem(instance_data)
         solver = EarliestStartSolver(problem)
         start_t = time.time()
         solution = solver.solve()
@@ -212,7 +195,7 @@ def solve_with_earliest_start(instance_data):
 
 def solve_with_genetic(instance_data):
     try:
-        problem = create_problem_instance(instance_data)
+        problem = load_problem(instance_data)
         # Reduce gens/pop for quicker large scale test if needed, or keep robust
         solver = GeneticSolver(problem, pop_size=50, generations=100) 
         start_t = time.time()
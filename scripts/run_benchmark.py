@@ -9,7 +9,7 @@ import random
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.core.generator import generate_random_instance
-from src.core.model import Job, ProblemInstance
+from src.core.loader import load_problem
 from src.solvers.greedy import GreedySolver
 from src.solvers.metaheuristic import GeneticSolver
 from src.solvers.simulated_annealing import SimulatedAnnealingSolver
@@ -39,7 +39,7 @@ def main():
     csv_path = os.path.join(OUT_DIR, 'results.csv')
     with open(csv_path, 'w', newline='') as csvfile:
         writer = csv.DictWriter(csvfile, fieldnames=['instance_id', 'n_jobs', 'n_machines', 'n_resources',
-                                                     'solver', 'makespan', 'time_s', 'valid', 'error'])
+                                                     'solver', 'makespan', 'lower_bound', 'gap', 'time_s', 'valid', 'error'])
         writer.writeheader()
 
         # Generate 10 instances with bounds: max 10 jobs, max 3 machines, max 3 resources
@@ -57,12 +57,8 @@ def main():
             # Print instance summary
             pretty_print_instance(data, i)
 
-            # Reconstruct objects (convert resource keys to int)
-            jobs = []
-            for j in data['jobs']:
-                jobs.append(Job(j['id'], j['duration'], {int(k): v for k, v in j['requirements'].items()}))
-            resources = {int(k): v for k, v in data['resources'].items()}
-            problem = ProblemInstance(data['num_machines'], resources, jobs)
+            # Reconstruct objects (resource keys normalised to int ids)
+            problem = load_problem(data)
 
             # Prepare solvers to run
             n = len(problem.jobs)
@@ -82,7 +78,7 @@ def main():
             # Run each solver and record results
             for name, solver_obj, run_fn in solvers:
                 print(f"\nRunning solver: {name} on instance {i}...")
-                row = {'instance_id': i, 'n_jobs': n, 'n_machines': m, 'n_resources': len(resources),
+                row = {'instance_id': i, 'n_jobs': n, 'n_machines': m, 'n_resources': len(problem.resources),
                        'solver': name, 'makespan': None, 'time_s': None, 'valid': False, 'error': ''}
                 try:
                     t0 = time.time()
@@ -92,6 +88,9 @@ def main():
 
                     row['time_s'] = round(elapsed, 4)
                     row['makespan'] = sol.makespan if sol is not None else None
+                    if sol is not None and sol.lower_bound is not None:
+                        row['lower_bound'] = sol.lower_bound
+                        row['gap'] = round(sol.gap, 4)
 
                     # validate solution
                     valid = problem.validate_solution(sol) if sol is not None else False
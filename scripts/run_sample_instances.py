@@ -7,7 +7,7 @@ import csv
 # add project root to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.core.model import Job, ProblemInstance
+from src.core.loader import load_problem
 from src.solvers.greedy import GreedySolver
 from src.solvers.metaheuristic import GeneticSolver
 from src.solvers.simulated_annealing import SimulatedAnnealingSolver
@@ -20,29 +20,6 @@ def load_instances(file_path: str):
     return data
 
 
-def build_problem_from_data(data_block: dict) -> ProblemInstance:
-    # data_block expected to contain keys: num_machines, resources, jobs
-    raw_resources = data_block.get('resources', {})
-    # Map resource names (strings) to integer ids starting at 1
-    name_to_id = {name: idx+1 for idx, name in enumerate(raw_resources.keys())}
-    resources = {name_to_id[name]: qty for name, qty in raw_resources.items()}
-
-    jobs = []
-    for j in data_block.get('jobs', []):
-        # Map job requirements keys to integer ids
-        reqs = {}
-        for rname, qty in j.get('requirements', {}).items():
-            if rname in name_to_id:
-                reqs[name_to_id[rname]] = qty
-            else:
-                # if resource name not known, skip
-                continue
-        jobs.append(Job(j['id'], j['duration'], reqs))
-
-    num_machines = data_block.get('num_machines', 1)
-    return ProblemInstance(num_machines, resources, jobs)
-
-
 def pretty_print_instance(name: str, data_block: dict):
     print(f"\n--- Instance: {name} ---")
     n_jobs = len(data_block.get('jobs', []))
@@ -75,7 +52,7 @@ def main():
             pretty_print_instance(inst_name, data_block)
 
             try:
-                problem = build_problem_from_data(data_block)
+                problem = load_problem(data_block)
             except Exception as e:
                 print(f"Failed to build ProblemInstance for {inst_name}: {e}")
                 continue
@@ -7,7 +7,7 @@ import sys
 # Add the project root to sys.path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from src.core.model import ProblemInstance, Job
+from src.core.loader import load_problem
 from src.solvers.greedy import GreedySolver
 from src.solvers.metaheuristic import GeneticSolver
 from src.solvers.simulated_annealing import SimulatedAnnealingSolver
@@ -25,17 +25,9 @@ def run_benchmark(num_runs=1, jobs=[30, 60], machines=[4, 8]):
                 # Unique instance per run
                 data = generate_instance(num_jobs=n_jobs, num_machines=n_m, num_resources=res_count)
                 
-                # Reconstruct ProblemInstance (Manual mapping usually done in load_problem)
-                from src.core.model import Job
-                jobs_obj = []
-                for j in data['jobs']:
-                    jobs_obj.append(Job(
-                        id=j['id'], 
-                        duration=j['duration'], 
-                        resource_requirements={int(k): v for k, v in j['requirements'].items()}
-                    ))
-                resources = {int(k): v for k, v in data['resources'].items()}
-                problem = ProblemInstance(data['num_machines'], resources, jobs_obj)
+                # Reconstruct ProblemInstance
+                problem = load_problem(data)
+                jobs_obj = problem.jobs
                 
                 # 1. Greedy LPT (Baseline)
                 start = time.time()
@@ -62,15 +54,14 @@ def run_benchmark(num_runs=1, jobs=[30, 60], machines=[4, 8]):
                 
                 # 5. Random Search (Baseline)
                 start = time.time()
-                best_random = float('inf')
-                # Run 1000 samples for better baseline
+                # Run 1000 samples for better baseline, decoded in one batch
+                perms = []
                 for _ in range(1000):
-                    perm = jobs_obj[:]
+                    perm = list(range(len(jobs_obj)))
                     random.shuffle(perm)
-                    # Reuse scheduler from m_solver or sa_solver
-                    s_rnd = m_solver.scheduler.build_from_sequence(perm)
-                    if s_rnd.makespan < best_random:
-                        best_random = s_rnd.makespan
+                    perms.append(perm)
+                # Reuse scheduler from m_solver or sa_solver
+                best_random = int(m_solver.scheduler.evaluate_batch(perms).min())
                 time_random = time.time() - start
 
                 results.append({
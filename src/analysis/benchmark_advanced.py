@@ -7,7 +7,7 @@ import numpy as np
 import matplotlib.patches as patches
 
 from src.core.generator import generate_instance
-from src.core.model import Job, ProblemInstance
+from src.core.loader import load_problem
 from src.solvers.greedy import GreedySolver
 from src.solvers.metaheuristic import GeneticSolver
 from src.solvers.simulated_annealing import SimulatedAnnealingSolver
@@ -20,9 +20,7 @@ def run_advanced_benchmark():
     # 1. Configuración del problema (Instancia Retadora)
     data = generate_instance(num_jobs=300, num_machines=10, num_resources=5)
     
-    jobs = [Job(j['id'], j['duration'], {int(k): v for k, v in j['requirements'].items()}) for j in data['jobs']]
-    resources = {int(k): v for k, v in data['resources'].items()}
-    problem = ProblemInstance(data['num_machines'], resources, jobs)
+    problem = load_problem(data)
     
     # 2. Configurar Solvers
     ga_solver = GeneticSolver(problem, pop_size=100, generations=200, mutation_rate=0.25)
@@ -5,7 +5,7 @@ import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 from src.core.generator import generate_instance
-from src.core.model import Job, ProblemInstance
+from src.core.loader import load_problem
 from src.solvers.greedy import GreedySolver
 from src.solvers.metaheuristic import GeneticSolver
 from src.solvers.simulated_annealing import SimulatedAnnealingSolver
@@ -31,11 +31,7 @@ def run_benchmark():
         data = generate_instance(sc['jobs'], sc['machines'], num_resources=sc['resources'])
         
         # Reconstruir objetos
-        jobs = []
-        for j in data['jobs']:
-            jobs.append(Job(j['id'], j['duration'], {int(k): v for k, v in j['requirements'].items()}))
-        resources = {int(k): v for k, v in data['resources'].items()}
-        problem = ProblemInstance(data['num_machines'], resources, jobs)
+        problem = load_problem(data)
         
         # Solvers a comparar
         solvers = [
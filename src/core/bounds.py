@@ -0,0 +1,109 @@
+from dataclasses import dataclass
+from typing import List
+import numpy as np
+from src.core.model import ProblemInstance
+
+# The pairwise conflict matrix of the disjunctive bound is built for the
+# longest jobs only, so the bound stays cheap on large instances.
+DISJUNCTIVE_CANDIDATES = 200
+DISJUNCTIVE_SEEDS = 32
+
+
+@dataclass
+class LowerBounds:
+    """Makespan lower bounds of an instance; ``best`` is the strongest one."""
+    work: int          # ceil(total duration / m)
+    longest_job: int   # max duration
+    energy: int        # max over resources of ceil(sum(d_j * q_jr) / Q_r)
+    disjunctive: int   # longest chain of jobs that pairwise cannot overlap
+
+    @property
+    def best(self) -> int:
+        return max(self.work, self.longest_job, self.energy, self.disjunctive)
+
+
+def compute_lower_bounds(problem: ProblemInstance) -> LowerBounds:
+    """
+    Fast, solver-independent lower bounds on the makespan, from the compiled
+    problem in O(n*R) plus a small disjunctive clique search.
+    """
+    compiled = problem.compiled
+    durations = compiled.durations
+    if compiled.num_jobs == 0:
+        return LowerBounds(0, 0, 0, 0)
+
+    m = max(1, compiled.num_machines)
+    work = -(-int(durations.sum()) // m)
+    longest_job = int(durations.max())
+
+    energy = 0
+    capacities = compiled.capacities
+    if compiled.num_resources:
+        usable = capacities > 0
+        if usable.any():
+            totals = durations @ compiled.demand[:, usable]
+            energy = int((-(-totals // capacities[usable])).max())
+
+    return LowerBounds(work, longest_job, energy, _disjunctive_bound(problem))
+
+
+def lower_bound(problem: ProblemInstance) -> int:
+    return compute_lower_bounds(problem).best
+
+
+def _disjunctive_bound(problem: ProblemInstance) -> int:
+    """
+    Two jobs cannot overlap when together they need more than the capacity of
+    some resource, so the durations of a set of pairwise conflicting jobs (a
+    clique of the conflict graph) add up to a lower bound.
+    """
+    durations = problem.compiled.durations
+    return max((int(durations[clique].sum()) for clique in conflict_cliques(problem)), default=0)
+
+
+def conflict_cliques(problem: ProblemInstance) -> List[List[int]]:
+    """
+    Sets of job indices that pairwise cannot overlap (see _disjunctive_bound):
+    one per resource, plus greedy cliques among the longest jobs.
+    """
+    compiled = problem.compiled
+    durations = compiled.durations
+    demand = compiled.demand
+    capacities = compiled.capacities
+    cliques = []
+
+    # Jobs using more than half of a resource conflict with each other. On top
+    # of them fits the largest job that conflicts with the smallest of them.
+    for r in range(compiled.num_resources):
+        column = demand[:, r]
+        big = 2 * column > capacities[r]
+        if not big.any():
+            continue
+        clique = np.flatnonzero(big).tolist()
+        smallest = int(column[big].min())
+        extra = (~big) & (column + smallest > capacities[r])
+        if extra.any():
+            candidates = np.flatnonzero(extra)
+            clique.append(int(candidates[np.argmax(durations[candidates])]))
+        cliques.append(clique)
+
+    # General case: greedy cliques among the longest jobs
+    k = min(compiled.num_jobs, DISJUNCTIVE_CANDIDATES)
+    if k < 2 or compiled.num_resources == 0:
+        return cliques
+    order = np.argsort(-durations, kind='stable')[:k]
+    sub = demand[order]
+    conflict = ((sub[:, None, :] + sub[None, :, :]) > capacities).any(axis=2)
+    np.fill_diagonal(conflict, False)
+    for seed in range(min(k, DISJUNCTIVE_SEEDS)):
+        allowed = conflict[seed].copy()
+        clique = [seed]
+        # Candidates are sorted by decreasing duration: always add the longest one left
+        rest = np.flatnonzero(allowed)
+        while rest.size:
+            i = rest[0]
+            clique.append(i)
+            allowed &= conflict[i]
+            rest = np.flatnonzero(allowed)
+        cliques.append(order[clique].tolist())
+    return cliques
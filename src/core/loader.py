@@ -0,0 +1,61 @@
+import json
+from itertools import chain
+from typing import Dict, Any
+import numpy as np
+from src.core.model import CompiledProblem, ProblemInstance
+
+
+def load_problem(data: Dict[str, Any]) -> ProblemInstance:
+    """
+    Builds a ProblemInstance from the JSON structure used across the project:
+    {"num_machines": m, "resources": {name: capacity}, "jobs": [{"id", "duration", "requirements"}]}.
+    A wrapping {"data": {...}} block (as in data/sample.json) is accepted too.
+
+    Resource names are normalised to integer ids: numeric names ("1", 2) keep
+    their number, any other naming ("CommonTool", "R3") is numbered 1..R in
+    file order. The original names are kept in problem.resource_names.
+
+    The instance comes compiled (see CompiledProblem); its Job records are
+    only built when problem.jobs is first used.
+    """
+    if 'num_machines' not in data and isinstance(data.get('data'), dict):
+        data = data['data']
+
+    raw_resources = data.get('resources', {})
+    numeric = all(isinstance(name, int) or str(name).isdigit() for name in raw_resources)
+    if numeric:
+        name_to_id = {name: int(name) for name in raw_resources}
+    else:
+        name_to_id = {name: idx + 1 for idx, name in enumerate(raw_resources)}
+    # Requirements may spell numeric names as str or int independently of 'resources'
+    lookup = dict(name_to_id)
+    lookup.update({str(name): r_id for name, r_id in name_to_id.items()})
+    if numeric:
+        lookup.update({r_id: r_id for r_id in name_to_id.values()})
+
+    resources = {name_to_id[name]: cap for name, cap in raw_resources.items()}
+    # Straight to the compiled form: name -> dense resource index, requirements as flat triplets
+    position = {r_id: r for r, r_id in enumerate(resources)}
+    dense = {name: position[r_id] for name, r_id in lookup.items()}
+    raw_jobs = data.get('jobs', [])
+    job_ids = [j['id'] for j in raw_jobs]
+    durations = [j['duration'] for j in raw_jobs]
+    requirements = [j.get('requirements') or {} for j in raw_jobs]
+    try:
+        req_resources = list(map(dense.__getitem__, chain.from_iterable(requirements)))
+    except KeyError as e:
+        job = next(j for j, reqs in zip(raw_jobs, requirements) if e.args[0] in reqs)
+        raise ValueError(f"Job {job['id']} requires unknown resource {e.args[0]!r}.") from None
+    req_qtys = list(chain.from_iterable(map(dict.values, requirements)))
+    req_jobs = np.repeat(np.arange(len(raw_jobs)), list(map(len, requirements)))
+
+    num_machines = int(data.get('num_machines', 1))
+    compiled = CompiledProblem(num_machines, resources, job_ids, durations, req_jobs, req_resources, req_qtys)
+
+    resource_names = {r_id: str(name) for name, r_id in name_to_id.items()}
+    return ProblemInstance(num_machines, resources, None, resource_names=resource_names, compiled=compiled)
+
+
+def load_problem_file(path: str) -> ProblemInstance:
+    with open(path, 'r') as f:
+        return load_problem(json.load(f))
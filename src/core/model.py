@@ -1,7 +1,8 @@
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+import numpy as np
 
-@dataclass
+@dataclass(slots=True)
 class Job:
     id: int
     duration: int
@@ -14,50 +15,277 @@ class Solution:
     jobs: List[Job]
     makespan: int = 0
     valid: bool = True
+    lower_bound: Optional[int] = None  # Set by the solvers, see src.core.bounds
+
+    @property
+    def gap(self) -> Optional[float]:
+        """Relative optimality gap (makespan - lower_bound) / makespan, if a bound is known."""
+        if self.lower_bound is None:
+            return None
+        if self.makespan <= 0:
+            return 0.0
+        return max(0.0, (self.makespan - self.lower_bound) / self.makespan)
+
+class CompiledProblem:
+    """
+    Dense, index-based view of a ProblemInstance for the solvers' hot loops.
+
+    Jobs keep the order of problem.jobs and resources are renumbered 0..R-1 in
+    the order of problem.resources. The NumPy vectors/matrix serve vectorized
+    code (bounds, batch decoding); the plain lists and (resource, qty) tuples
+    serve scalar loops, where indexing a list is faster than a NumPy array.
+
+    It is built from flat requirement triplets (job k needs req_qtys[k] of
+    dense resource req_resources[k] for job index req_jobs[k], in job order),
+    so compiling is a few NumPy calls with no per-job Python work.
+    requirement_pairs are only grouped per job on first use.
+    """
+    __slots__ = ('num_jobs', 'num_machines', 'num_resources',
+                 'job_ids', 'job_index', 'resource_keys', 'resource_index',
+                 'durations', 'capacities', 'demand',
+                 'duration_list', 'capacity_list', '_requirements', '_requirement_pairs', '_pooled')
+
+    def __init__(self, num_machines: int, resources: Dict[int, int], job_ids: List[int], durations: List[int],
+                 req_jobs: List[int], req_resources: List[int], req_qtys: List[int]):
+        self.num_jobs = len(job_ids)
+        self.num_machines = num_machines
+        self.num_resources = len(resources)
+
+        self.job_ids = job_ids
+        self.job_index = dict(zip(job_ids, range(self.num_jobs)))
+        self.resource_keys = list(resources)
+        self.resource_index = {key: r for r, key in enumerate(self.resource_keys)}
+
+        self.durations = np.array(durations, dtype=np.int64)
+        self.capacities = np.array(list(resources.values()), dtype=np.int64)
+        self.duration_list = self.durations.tolist()
+        self.capacity_list = self.capacities.tolist()
+
+        # Zero quantities stay in the triplets (Job records keep them) but not in demand/pairs
+        self._requirements = tuple(np.array(values, dtype=np.int64)
+                                   for values in (req_jobs, req_resources, req_qtys))
+        jobs, res, qtys = self._requirements
+        self.demand = np.zeros((self.num_jobs, self.num_resources), dtype=np.int64)
+        used = qtys > 0
+        self.demand[jobs[used], res[used]] = qtys[used]
+        self._requirement_pairs: Optional[List[tuple]] = None
+        self._pooled = None
+
+    @classmethod
+    def from_jobs(cls, num_machines: int, resources: Dict[int, int], jobs: List[Job]) -> 'CompiledProblem':
+        """Compiles Job records (the loader compiles straight from the file instead)."""
+        index = {key: r for r, key in enumerate(resources)}
+        req_jobs, req_resources, req_qtys = [], [], []
+        try:
+            for j, job in enumerate(jobs):
+                for key, qty in job.resource_requirements.items():
+                    req_jobs.append(j)
+                    req_resources.append(index[key])
+                    req_qtys.append(qty)
+        except KeyError as e:
+            raise ValueError(f"A job requires unknown resource {e.args[0]!r}.") from None
+        return cls(num_machines, resources, [job.id for job in jobs], [job.duration for job in jobs],
+                   req_jobs, req_resources, req_qtys)
+
+    @property
+    def requirement_pairs(self) -> List[tuple]:
+        """Per job, its (resource index, qty) pairs with qty > 0, in requirement order."""
+        if self._requirement_pairs is None:
+            jobs, res, qtys = self._requirements
+            used = qtys > 0
+            pairs = list(zip(res[used].tolist(), qtys[used].tolist()))
+            bounds = np.searchsorted(jobs[used], np.arange(self.num_jobs + 1)).tolist()
+            self._requirement_pairs = [tuple(pairs[lo:hi]) for lo, hi in zip(bounds[:-1], bounds[1:])]
+        return self._requirement_pairs
+
+    def with_machine_pool(self) -> Tuple[List[int], List[tuple]]:
+        """
+        (capacities, requirement pairs) with the identical machines as one more
+        cumulative resource of capacity num_machines, at index num_resources:
+        every job needs one unit of it. Machine ids are then handed out from
+        the start times (SolutionBuilder.assign_machines).
+        """
+        if self._pooled is None:
+            pool = self.num_resources
+            self._pooled = (self.capacity_list + [self.num_machines],
+                            [pairs + ((pool, 1),) for pairs in self.requirement_pairs])
+        return self._pooled
+
+    def make_jobs(self) -> List[Job]:
+        """Job records of the compiled instance (original resource ids, zero quantities included)."""
+        jobs, res, qtys = self._requirements
+        keys = self.resource_keys
+        requirements = [{} for _ in range(self.num_jobs)]
+        for j, r, qty in zip(jobs.tolist(), res.tolist(), qtys.tolist()):
+            requirements[j][keys[r]] = qty
+        return [Job(job_id, duration, reqs)
+                for job_id, duration, reqs in zip(self.job_ids, self.duration_list, requirements)]
 
 class ProblemInstance:
-    def __init__(self, num_machines: int, resources: Dict[int, int], jobs: List[Job]):
+    def __init__(self, num_machines: int, resources: Dict[int, int], jobs: Optional[List[Job]],
+                 resource_names: Optional[Dict[int, str]] = None,
+                 compiled: Optional[CompiledProblem] = None):
         """
         :param num_machines: Number of identical machines (m)
         :param resources: Dictionary Resource ID -> Total Capacity (Q_k)
-        :param jobs: List of Job objects
+        :param jobs: List of Job objects (None if ``compiled`` is given; built on first use)
+        :param resource_names: Optional Resource ID -> original name (set by load_problem)
+        :param compiled: Optional CompiledProblem of the instance (set by load_problem)
         """
+        if jobs is None and compiled is None:
+            raise ValueError("ProblemInstance needs jobs or a compiled problem.")
         self.num_machines = num_machines
         self.resources = resources
-        self.jobs = jobs
+        self._jobs = jobs
+        self.resource_names = resource_names or {}
+        self._compiled = compiled
+
+    @property
+    def jobs(self) -> List[Job]:
+        if self._jobs is None:
+            self._jobs = self._compiled.make_jobs()
+        return self._jobs
+
+    @jobs.setter
+    def jobs(self, jobs: List[Job]):
+        self._jobs = jobs
+        self._compiled = None
 
-    def validate_solution(self, solution: Solution) -> bool:
-        # 1. Check if all jobs are assigned
+    @property
+    def compiled(self) -> CompiledProblem:
+        """Index-based form used by the solvers (built once, on first use)."""
+        if self._compiled is None:
+            self._compiled = CompiledProblem.from_jobs(self.num_machines, self.resources, self._jobs)
+        return self._compiled
+
+    def validate_solution(self, solution: Solution) -> 'ValidationReport':
+        """
+        Checks a schedule with a sweep over start/end events: O(n log n + n*R),
+        independent of the makespan. Returns a ValidationReport listing every
+        violation; the report is truthy only when the schedule is valid, so it
+        can be used wherever a bool was expected.
+        """
+        violations: List[Violation] = []
+
+        # 1. Every job of the instance is scheduled exactly once, with a start and a machine
+        expected = {job.id for job in self.jobs}
+        seen = set()
+        scheduled: List[Job] = []
         for job in solution.jobs:
+            if job.id in seen:
+                violations.append(Violation('duplicate_job', jobs=[job.id]))
+                continue
+            seen.add(job.id)
+            if job.id not in expected:
+                violations.append(Violation('unknown_job', jobs=[job.id]))
             if job.start_time is None or job.assigned_machine is None:
-                print(f"Job {job.id} not assigned.")
-                return False
+                violations.append(Violation('unassigned', jobs=[job.id]))
+            elif not 1 <= job.assigned_machine <= self.num_machines:
+                violations.append(Violation('invalid_machine', time=job.start_time,
+                                            machine=job.assigned_machine, jobs=[job.id]))
+            else:
+                scheduled.append(job)
+        for job_id in sorted(expected - seen, key=str):
+            violations.append(Violation('missing_job', jobs=[job_id]))
 
-        # 2. Check machine overlap
-        machine_schedules = {i: [] for i in range(1, self.num_machines + 1)}
-        for job in solution.jobs:
-            machine_schedules[job.assigned_machine].append((job.start_time, job.start_time + job.duration))
-        
-        for m_id, intervals in machine_schedules.items():
-            intervals.sort()
-            for i in range(len(intervals) - 1):
-                if intervals[i][1] > intervals[i+1][0]:
-                    print(f"Overlap on machine {m_id}")
-                    return False
-
-        # 3. Check resource availability at every time step
-        # This is a discrete time check. For optimization, we only check start/end events, but brute force is ok for now.
-        max_time = solution.makespan
-        for t in range(max_time + 1):
-            current_usage = {r_id: 0 for r_id in self.resources}
-            for job in solution.jobs:
-                if job.start_time <= t < job.start_time + job.duration:
-                    for r_id, qty in job.resource_requirements.items():
-                        current_usage[r_id] += qty
-            
-            for r_id, capacity in self.resources.items():
-                if current_usage[r_id] > capacity:
-                    print(f"Resource {r_id} violation at time {t}. Used {current_usage[r_id]}, Cap {capacity}")
-                    return False
-        
-        return True
+        if scheduled:
+            last_end = max(job.start_time + job.duration for job in scheduled)
+            if last_end != solution.makespan:
+                violations.append(Violation('makespan', time=last_end,
+                                            detail=f"reported {solution.makespan}, last job ends at {last_end}"))
+
+        # 2. Machine overlap: per machine, each job must start after every earlier job ended
+        # (zero-length jobs occupy no time, as in the resource sweep below)
+        by_machine: Dict[int, List[Job]] = {}
+        for job in scheduled:
+            if job.duration > 0:
+                by_machine.setdefault(job.assigned_machine, []).append(job)
+        for m_id, jobs in sorted(by_machine.items()):
+            jobs.sort(key=lambda j: j.start_time)
+            latest = jobs[0]
+            for job in jobs[1:]:
+                if job.start_time < latest.start_time + latest.duration:
+                    violations.append(Violation('machine_overlap', time=job.start_time, machine=m_id,
+                                                jobs=[latest.id, job.id]))
+                if job.start_time + job.duration > latest.start_time + latest.duration:
+                    latest = job
+
+        # 3. Resource capacity: sweep start/end events (ends first, intervals are [S, E))
+        events = []
+        for job in scheduled:
+            if job.duration > 0 and job.resource_requirements:
+                events.append((job.start_time, 1, job))
+                events.append((job.start_time + job.duration, 0, job))
+        events.sort(key=lambda e: (e[0], e[1]))
+        usage: Dict = {}
+        active: Dict = {}
+        i = 0
+        while i < len(events):
+            t = events[i][0]
+            touched = set()
+            while i < len(events) and events[i][0] == t:
+                _, is_start, job = events[i]
+                for r_id, qty in job.resource_requirements.items():
+                    if qty == 0:
+                        continue
+                    if is_start:
+                        usage[r_id] = usage.get(r_id, 0) + qty
+                        active.setdefault(r_id, set()).add(job.id)
+                        touched.add(r_id)
+                    else:
+                        usage[r_id] -= qty
+                        active[r_id].discard(job.id)
+                i += 1
+            for r_id in touched:
+                capacity = self.resources.get(r_id, 0)
+                if usage[r_id] > capacity:
+                    violations.append(Violation('resource_capacity', time=t, resource=r_id,
+                                                jobs=sorted(active[r_id], key=str),
+                                                detail=f"used {usage[r_id]}, capacity {capacity}"))
+
+        return ValidationReport(violations)
+
+@dataclass
+class Violation:
+    """One broken constraint found by ProblemInstance.validate_solution."""
+    kind: str  # unassigned, invalid_machine, duplicate_job, unknown_job, missing_job, makespan, machine_overlap, resource_capacity
+    time: Optional[int] = None
+    resource: Optional[int] = None
+    machine: Optional[int] = None
+    jobs: List[int] = field(default_factory=list)
+    detail: str = ''
+
+    def __str__(self) -> str:
+        parts = [self.kind]
+        if self.time is not None:
+            parts.append(f"t={self.time}")
+        if self.machine is not None:
+            parts.append(f"machine {self.machine}")
+        if self.resource is not None:
+            parts.append(f"resource {self.resource}")
+        if self.jobs:
+            parts.append(f"jobs {self.jobs}")
+        if self.detail:
+            parts.append(self.detail)
+        return ", ".join(parts)
+
+@dataclass
+class ValidationReport:
+    violations: List[Violation] = field(default_factory=list)
+
+    @property
+    def valid(self) -> bool:
+        return not self.violations
+
+    def __bool__(self) -> bool:
+        return self.valid
+
+    def __str__(self) -> str:
+        if self.valid:
+            return "Valid schedule."
+        return f"{len(self.violations)} violation(s):\n" + "\n".join(f"  - {v}" for v in self.violations)
+
+    def raise_if_invalid(self, source: str = "Solver"):
+        """Used by the solvers' debug mode after every improvement."""
+        if not self.valid:
+            raise RuntimeError(f"{source} produced an invalid schedule. {self}")
@@ -0,0 +1,36 @@
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+from src.core.model import ProblemInstance
+
+
+@dataclass
+class PartialScheduleData:
+    """
+    Static data of the searches over serial-SGS partial schedules
+    (BranchAndBoundSolver, BeamSearchSolver). The machines are one more
+    cumulative resource, the last one (CompiledProblem.with_machine_pool).
+    """
+    capacities: List[int]
+    requirements: List[tuple]  # Per job, (resource, qty) pairs including the machine pool
+    durations: List[int]
+    energy: List[int]          # Work to place per resource (duration * qty), a fresh list
+    twin: List[int]            # Previous identical job (same duration and requirements), -1 if none
+
+
+def partial_schedule_data(problem: ProblemInstance) -> PartialScheduleData:
+    compiled = problem.compiled
+    capacities, requirements = compiled.with_machine_pool()
+    durations = compiled.duration_list
+    energy = [0] * len(capacities)
+    for idx, pairs in enumerate(requirements):
+        for r, qty in pairs:
+            energy[r] += durations[idx] * qty
+
+    # Identical jobs: a search may schedule job idx only after its previous twin
+    twin = [-1] * compiled.num_jobs
+    last_seen: Dict[Tuple, int] = {}
+    for idx, pairs in enumerate(compiled.requirement_pairs):
+        key = (durations[idx], pairs)
+        twin[idx] = last_seen.get(key, -1)
+        last_seen[key] = idx
+    return PartialScheduleData(capacities, requirements, durations, energy, twin)
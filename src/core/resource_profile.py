@@ -0,0 +1,140 @@
+from bisect import bisect_left, bisect_right
+from typing import List, Optional, Sequence, Tuple
+
+# A job's demand as (dense resource index, quantity) pairs, see CompiledProblem.requirement_pairs
+Requirements = Sequence[Tuple[int, int]]
+
+
+class ResourceProfile:
+    """
+    Cumulative resource usage stored as a step function per resource.
+
+    Usage only changes when a job starts or ends, so for every resource we keep
+    the sorted breakpoints ``times`` and the level ``levels[i]`` that holds on
+    ``[times[i], times[i+1])``. Queries locate the first breakpoint with a binary
+    search and then walk only the breakpoints inside the queried window, so
+    their cost depends on the number of overlapping jobs, never on durations.
+
+    Resources are dense indices 0..R-1 (see ProblemInstance.compiled).
+    """
+    __slots__ = ('capacities', '_times', '_levels')
+
+    def __init__(self, capacities: Sequence[int]):
+        """
+        :param capacities: Total capacity (Q_k) of each resource index
+        """
+        self.capacities = capacities
+        self._times: List[List[int]] = [[0] for _ in capacities]
+        self._levels: List[List[int]] = [[0] for _ in capacities]
+
+    def copy(self) -> 'ResourceProfile':
+        clone = ResourceProfile.__new__(ResourceProfile)
+        clone.capacities = self.capacities
+        clone._times = [times[:] for times in self._times]
+        clone._levels = [levels[:] for levels in self._levels]
+        return clone
+
+    def earliest_start(self, start: int, duration: int, requirements: Requirements) -> Optional[int]:
+        """
+        Earliest t >= start such that the job fits during [t, t + duration).
+        Returns None if some requirement exceeds the total capacity.
+
+        When a window is blocked we jump straight past the blocking segments,
+        so only release times (breakpoints) are ever tried as candidates.
+        """
+        if duration <= 0:
+            return start
+        capacities = self.capacities
+        for r, qty in requirements:
+            if qty > capacities[r]:
+                return None
+
+        t = start
+        moved = True
+        while moved:
+            moved = False
+            for r, qty in requirements:
+                limit = capacities[r] - qty
+                i = self._first_conflict(r, t, t + duration, limit)
+                if i < 0:
+                    continue
+                times = self._times[r]
+                levels = self._levels[r]
+                # The last segment is always 0 (every job ends), so this terminates.
+                i += 1
+                while levels[i] > limit:
+                    i += 1
+                t = times[i]
+                moved = True
+        return t
+
+    def energy_from(self, r: int, t: int) -> int:
+        """Usage of resource ``r`` integrated over [t, inf)."""
+        times = self._times[r]
+        levels = self._levels[r]
+        i = bisect_right(times, t) - 1
+        energy = 0
+        # The last segment is always 0, so every other one has an end
+        for k in range(i, len(times) - 1):
+            energy += levels[k] * (times[k + 1] - max(times[k], t))
+        return energy
+
+    def signature_from(self, t: int) -> Tuple[Tuple[Tuple[int, int], ...], ...]:
+        """Hashable (breakpoint, level) pairs of every resource over [t, inf)."""
+        signature = []
+        for times, levels in zip(self._times, self._levels):
+            i = bisect_right(times, t) - 1
+            signature.append(((t, levels[i]),) + tuple(zip(times[i + 1:], levels[i + 1:])))
+        return tuple(signature)
+
+    def reserve(self, start: int, end: int, requirements: Requirements):
+        """Adds the job's usage on [start, end)."""
+        self._apply(start, end, requirements, 1)
+
+    def release(self, start: int, end: int, requirements: Requirements):
+        """Removes usage previously added with ``reserve``."""
+        self._apply(start, end, requirements, -1)
+
+    def _apply(self, start: int, end: int, requirements: Requirements, sign: int):
+        if end <= start:
+            return
+        for r, qty in requirements:
+            i = self._split(r, start)
+            j = self._split(r, end)
+            levels = self._levels[r]
+            delta = sign * qty
+            for k in range(i, j):
+                levels[k] += delta
+            if sign < 0:
+                self._merge(r, i, j)
+
+    def _split(self, r: int, t: int) -> int:
+        """Ensures ``t`` is a breakpoint of resource ``r`` and returns its index."""
+        times = self._times[r]
+        i = bisect_left(times, t)
+        if i == len(times) or times[i] != t:
+            times.insert(i, t)
+            levels = self._levels[r]
+            levels.insert(i, levels[i - 1])
+        return i
+
+    def _merge(self, r: int, i: int, j: int):
+        """Drops redundant breakpoints at indices j and i after a release."""
+        times = self._times[r]
+        levels = self._levels[r]
+        for k in (j, i):
+            if 0 < k < len(times) and levels[k] == levels[k - 1]:
+                del times[k]
+                del levels[k]
+
+    def _first_conflict(self, r: int, start: int, end: int, limit: int) -> int:
+        """Index of the first segment overlapping [start, end) whose level exceeds ``limit``, or -1."""
+        times = self._times[r]
+        levels = self._levels[r]
+        i = bisect_right(times, start) - 1
+        n = len(times)
+        while i < n and times[i] < end:
+            if levels[i] > limit:
+                return i
+            i += 1
+        return -1
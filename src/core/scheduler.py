@@ -1,157 +1,370 @@
-from typing import List, Dict, Tuple
+import heapq
+from bisect import bisect_right
+from typing import List, Tuple, Optional
+import numpy as np
 from src.core.model import Job, Solution, ProblemInstance
+from src.core.resource_profile import ResourceProfile
 
 class SolutionBuilder:
     """
     Centralized logic for building a schedule from a sequence of jobs.
     Implements Event-Based Time optimization to avoid t+=1 bottleneck.
+
+    Sequences are decoded internally as indices into problem.jobs (jobs are
+    matched by id) over problem.compiled, so the hot loop never touches Job
+    objects or resource dicts. Job nodes and the Solution are only
+    materialized when asked for.
+
+    Machine modes:
+    - 'dedicated' (default): each job goes to the machine where it can start
+      earliest, never before that machine's last job has finished.
+    - 'cumulative': the identical machines are one more cumulative resource of
+      capacity num_machines, so a job may fill any gap where fewer than m jobs
+      run. Machine ids are handed out afterwards from a min-heap of free times.
+      Decode cost does not depend on the number of machines.
+
+    Checkpoints: with checkpoint_interval=k the builder keeps a snapshot of its
+    state (machine free times, resource profile, makespan) every k positions of
+    the last decoded sequence. rebuild_from() resumes from the nearest snapshot
+    instead of decoding the unchanged prefix again, and revert() undoes the
+    last rebuild (e.g. after a rejected local-search move).
     """
-    def __init__(self, problem: ProblemInstance):
+    MACHINE_MODES = ('dedicated', 'cumulative')
+    # Cells (rows x resources x time units) of the time-indexed usage array that
+    # evaluate_batch allocates at once; larger batches are split into chunks.
+    BATCH_MAX_CELLS = 1 << 24
+    # Beyond this many time units evaluate_batch decodes row by row instead
+    BATCH_MAX_HORIZON = 1 << 15
+
+    def __init__(self, problem: ProblemInstance, machine_mode: str = 'dedicated',
+                 checkpoint_interval: int = 0):
+        if machine_mode not in self.MACHINE_MODES:
+            raise ValueError(f"Unknown machine_mode '{machine_mode}'. Expected one of {self.MACHINE_MODES}.")
         self.problem = problem
+        self.machine_mode = machine_mode
+        self.checkpoint_interval = checkpoint_interval
+
+        compiled = problem.compiled
+        self._index_by_id = compiled.job_index
+        self._durations = compiled.duration_list
+        if machine_mode == 'cumulative':
+            self._capacities, self._requirements = compiled.with_machine_pool()
+        else:
+            self._capacities = compiled.capacity_list
+            self._requirements = compiled.requirement_pairs
+
+        # State of the last decoded sequence (used by rebuild_from)
+        self._sequence: List[int] = []
+        self._starts: List[int] = []
+        self._machines: List[int] = []
+        self._snapshots: List[Tuple[int, List[int], ResourceProfile, int]] = []
+        self._snapshot_positions: List[int] = []
+        self._final_makespan = 0
+        self._undo = None
 
     def build_from_sequence(self, sequence: List[Job]) -> Solution:
         """
-        Constructs a schedule by assigning jobs in the given order 
+        Constructs a schedule by assigning jobs in the given order
         to the earliest available feasible slot.
         """
+        return self.build_from_indices(self._to_indices(sequence))
+
+    def build_from_indices(self, sequence: List[int]) -> Solution:
+        """Same as build_from_sequence, for a sequence of indices into problem.jobs."""
+        self._decode_full(sequence)
+        return self.to_solution()
+
+    def evaluate_makespan(self, sequence: List[int], position: Optional[int] = None) -> int:
+        """
+        Makespan of a sequence of indices into problem.jobs. No Job or Solution
+        objects are created; call to_solution() afterwards if the schedule is
+        worth keeping.
+
+        Decoding resumes after the prefix shared with the last decoded sequence.
+        Callers that already know where the sequences start to differ can pass
+        ``position`` to skip the prefix comparison.
+        """
+        last = self._sequence
+        if position is None:
+            limit = min(len(last), len(sequence))
+            position = 0
+            while position < limit and last[position] == sequence[position]:
+                position += 1
+            if position == len(last) == len(sequence) and self._snapshots:
+                return self._final_makespan
+        if not self._snapshots:
+            self._decode_full(sequence)
+        else:
+            self._resume(position, sequence[position:])
+        return self._final_makespan
+
+    def evaluate_batch(self, perm_matrix) -> np.ndarray:
+        """
+        Makespans of many sequences at once. ``perm_matrix`` is a (P x n)
+        integer array, each row a permutation of indices into problem.jobs.
+        Returns an int64 vector of P makespans, equal to evaluate_makespan of
+        each row.
+
+        All rows are decoded together, one sequence position per step, on a
+        time-indexed (horizon x R x P) usage array: each step is a handful of
+        vectorized passes over the active time window of all rows.
+        Rows are processed in chunks of at most BATCH_MAX_CELLS cells. When the
+        horizon is too long for a time-indexed array (long durations), rows
+        are decoded one by one with evaluate_makespan instead. The builder's own state (last
+        sequence, checkpoints) is left untouched, except in that fallback.
+        """
+        perms = np.asarray(perm_matrix, dtype=np.int64)
+        if perms.ndim != 2:
+            raise ValueError("perm_matrix must be a 2-D (P x n) array.")
+        num_rows, n = perms.shape
+        if num_rows == 0 or n == 0:
+            return np.zeros(num_rows, dtype=np.int64)
+
+        compiled = self.problem.compiled
+        durations = compiled.durations
+        demand = compiled.demand
+        capacities = compiled.capacities
+        if self.machine_mode == 'cumulative':
+            demand = np.hstack([demand, np.ones((compiled.num_jobs, 1), dtype=np.int64)])
+            capacities = np.append(capacities, self.problem.num_machines)
+        too_big = (demand > capacities).any(axis=1)
+        used = np.unique(perms)
+        if too_big[used].any():
+            idx = int(used[too_big[used]][0])
+            raise ValueError(f"Job {compiled.job_ids[idx]} requires more of a resource than its capacity.")
+
+        # No serial schedule of these jobs can end after the sum of their durations
+        horizon = int(durations[perms[0]].sum()) + 1
+        cells_per_row = max(1, demand.shape[1]) * horizon
+        chunk = self.BATCH_MAX_CELLS // cells_per_row
+        if chunk == 0 or horizon > self.BATCH_MAX_HORIZON:
+            # Lexicographic order so consecutive rows share prefixes and resume from checkpoints
+            sequences = perms.tolist()
+            makespans = np.empty(num_rows, dtype=np.int64)
+            for i in sorted(range(num_rows), key=sequences.__getitem__):
+                makespans[i] = self.evaluate_makespan(sequences[i])
+            return makespans
+
+        makespans = np.empty(num_rows, dtype=np.int64)
+        for lo in range(0, num_rows, chunk):
+            makespans[lo:lo + chunk] = self._decode_batch(perms[lo:lo + chunk], durations, demand, capacities, horizon)
+        return makespans
+
+    def _decode_batch(self, perms: np.ndarray, durations: np.ndarray, demand: np.ndarray,
+                      capacities: np.ndarray, horizon: int) -> np.ndarray:
+        num_rows, n = perms.shape
+        rows = np.arange(num_rows)
+        cumulative = self.machine_mode == 'cumulative'
+        # Only resources some job uses can block anything
+        active = np.flatnonzero(demand.any(axis=0))
+        demand = demand[:, active].astype(np.int32)
+        capacities = capacities[active].astype(np.int32)
+        durations = durations.astype(np.int32)
+        num_res = len(active)
+
+        # Time-major layout: per-step work is vectorized across the rows
+        usage = np.zeros((horizon, num_res, num_rows), dtype=np.int32)
+        flat_usage = usage.reshape(-1)
+        stride = num_res * num_rows
+        machine_free = np.zeros((self.problem.num_machines, num_rows), dtype=np.int32)
+        makespan = np.zeros(num_rows, dtype=np.int32)
+        times = np.arange(1, horizon + 1, dtype=np.int32)[:, None]  # t + 1
+
+        for i in range(n):
+            jobs = perms[:, i]
+            duration = durations[jobs]
+            need = demand[jobs]
+            earliest = np.zeros(num_rows, dtype=np.int32) if cumulative else machine_free.min(axis=0)
+
+            # Active window: nothing starts before the earliest machine release,
+            # and every row can start its job by its own makespan.
+            w0 = int(earliest.min())
+            w1 = min(horizon, int(makespan.max()) + int(duration.max()) + 1)
+            window = usage[w0:w1]
+            t1 = times[:w1 - w0]
+            offset = earliest - w0
+
+            blocked = np.zeros((w1 - w0, num_rows), dtype=bool)
+            limit = (capacities - need).T
+            for r in range(num_res):
+                blocked |= window[:, r, :] > limit[r]
+            # last[u] = 1 + last blocked unit at or before u (units before the
+            # row's earliest start count as blocked), so [u - d + 1, u] is free
+            # iff last[u] <= u + 1 - d. The first such u gives the start.
+            last = blocked * t1
+            np.maximum(last[0], offset, out=last[0])
+            if len(last) <= 64:
+                for u in range(1, len(last)):
+                    np.maximum(last[u - 1], last[u], out=last[u])
+            else:
+                k = 1
+                while k < len(last):
+                    np.maximum(last[k:], last[:-k], out=last[k:])
+                    k *= 2
+            end = (last <= t1 - duration).argmax(axis=0)
+            start = np.where(duration > 0, end - duration + 1, offset) + w0
+            finish = start + duration
+
+            if not cumulative:
+                # Lowest machine already free at the start time
+                machine = (machine_free <= start).argmax(axis=0)
+                machine_free[machine, rows] = finish
+            np.maximum(makespan, finish, out=makespan)
+
+            # Reserve [start, finish) of every (row, resource) the job uses
+            cells = np.flatnonzero(((need > 0) & (duration > 0)[:, None]).reshape(-1))
+            if cells.size:
+                row = cells // num_res
+                lengths = duration[row]
+                base = start[row].astype(np.int64) * stride + (cells % num_res) * num_rows + row
+                steps = np.arange(int(lengths.sum())) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+                flat_usage[np.repeat(base, lengths) + steps * stride] += np.repeat(need.reshape(-1)[cells], lengths)
+
+        return makespan.astype(np.int64)
+
+    def rebuild_from(self, position: int, new_suffix: List[Job]) -> Solution:
+        """
+        Decodes ``last_sequence[:position] + new_suffix`` reusing the snapshot
+        closest to (and not after) ``position``. Only the jobs after that
+        snapshot are placed again.
+        """
+        if not self._snapshots:
+            self._decode_full(self._sequence[:position] + self._to_indices(new_suffix))
+        else:
+            self._resume(position, self._to_indices(new_suffix))
+        return self.to_solution()
+
+    def revert(self):
+        """Restores the state from before the last rebuild_from call."""
+        if self._undo is None:
+            raise RuntimeError("Nothing to revert: no rebuild_from since the last full build.")
+        k, snapshots, positions, snap_pos, starts, machines, position, suffix, makespan = self._undo
+        self._undo = None
+        self._snapshots[k:] = snapshots
+        self._snapshot_positions[k:] = positions
+        self._starts[snap_pos:] = starts
+        self._machines[snap_pos:] = machines
+        self._sequence[position:] = suffix
+        self._final_makespan = makespan
+
+    def to_solution(self) -> Solution:
+        """Materializes the last decoded schedule as a Solution."""
+        jobs = self.problem.jobs
+        # Fresh Job nodes to avoid side effects on the original objects in multiple runs
+        solution_jobs = [
+            Job(id=jobs[idx].id, duration=jobs[idx].duration, resource_requirements=jobs[idx].resource_requirements,
+                start_time=start_t, assigned_machine=m_id)
+            for idx, start_t, m_id in zip(self._sequence, self._starts, self._machines)
+        ]
+        if self.machine_mode == 'cumulative':
+            self.assign_machines(solution_jobs)
+        return Solution(jobs=solution_jobs, makespan=self._final_makespan)
+
+    def solution_from_starts(self, starts: List[int], valid: bool = True) -> Solution:
+        """
+        Solution with job i of problem.jobs starting at starts[i] (a schedule
+        feasible with the machines as a cumulative resource); machine ids are
+        handed out by assign_machines. The builder's state is left untouched.
+        """
+        jobs = [Job(id=job.id, duration=job.duration, resource_requirements=job.resource_requirements,
+                    start_time=int(start))
+                for job, start in zip(self.problem.jobs, starts)]
+        self.assign_machines(jobs)
+        makespan = max((job.start_time + job.duration for job in jobs), default=0)
+        return Solution(jobs=jobs, makespan=makespan, valid=valid)
+
+    def _to_indices(self, sequence: List[Job]) -> List[int]:
+        index_by_id = self._index_by_id
+        try:
+            return [index_by_id[job.id] for job in sequence]
+        except KeyError as e:
+            raise ValueError(f"Job {e.args[0]} does not belong to this problem instance.") from None
+
+    def _decode_full(self, sequence: List[int]):
+        self._sequence = list(sequence)
+        self._starts = []
+        self._machines = []
+        self._snapshots = []
+        self._snapshot_positions = []
+        self._undo = None
         # Machine availability times (when does each machine become free?)
-        machine_free_time = {i: 0 for i in range(1, self.problem.num_machines + 1)}
-        
-        # Resource availability tracking
-        # We need to track strictly when resources are used.
-        # Since we use Event-Based Time, we can just query a usage map.
-        resource_timeline = {} # t -> {r_id -> qty}
-
-        solution_jobs = []
-        global_makespan = 0
-        
-        # We start with 0 as a candidate time
-        # Completion times of scheduled jobs will be added to this set
-        completion_times = {0} 
-
-        for job in sequence:
-            # Clone job to avoid side effects on the original object in multiple runs
-            job_node = Job(
-                id=job.id,
-                duration=job.duration,
-                resource_requirements=job.resource_requirements
-            )
-            
-            best_machine = -1
-            best_start_time = float('inf')
-            
-            # Find earliest slot across all machines
-            # We check candidate start times.
-            # A valid start time is likely to be:
-            # 1. When a machine becomes free
-            # 2. When a resource is released (which is a job completion time)
-            
-            # Optimization: 
-            # We only need to check time points >= machine_free_time[m]
-            # that match a completion_time (or the machine_free_time itself).
-            
-            # Collect all relevant time points
-            # 1. Current free times of machines are critical candidates
-            # (already implicitly in completion_times if we update it correctly, 
-            # but let's be explicit)
-            
-            current_candidates = sorted([t for t in completion_times])
-            
-            possible_starts = []
-            
-            for m_id in range(1, self.problem.num_machines + 1):
-                m_free = machine_free_time[m_id]
-                
-                # Filter candidates: must be >= machine availability
-                # And we also add m_free as a candidate itself if not present
-                valid_candidates = [t for t in current_candidates if t >= m_free]
-                if m_free not in completion_times:
-                     # This handles case where machine free time is not a job end (e.g. t=0)
-                     # Or if we want to be safe, just add m_free to the check list
-                     valid_candidates.insert(0, m_free)
-                     valid_candidates.sort()
-
-                # Find first valid time 
-                found_t = -1
-                for t in valid_candidates:
-                     if self._check_resources(t, job_node.duration, job_node.resource_requirements, resource_timeline):
-                         found_t = t
-                         break
-                
-                # Fallback: if no existing candidate works (unlikely if we track all ends), 
-                # strictly speaking, resources become free at completion times.
-                # So if it doesn't fit at any completion time, it won't fit in between 
-                # (unless duration is 0, but duration >= 1).
-                # Actually, resource usage is constant intervals [S, E).
-                # Availability changes ONLY at S and E.
-                # Since we want to START, we look for a time T such that for [T, T+dur), R is ok.
-                # If R is not ok at T, it means some overlapping job is using it.
-                # We only need to check T when some job ends.
-                
-                if found_t != -1:
-                    possible_starts.append((found_t, m_id))
-
-            # Si no encontramos ningún start entre los completion_times, hacemos fallback
-            if not possible_starts:
-                # Limite superior razonable: último completion + suma de duraciones pendientes
-                sorted_ct = sorted(completion_times)
-                last_ct = sorted_ct[-1] if sorted_ct else 0
-                remaining_horizon = last_ct + sum(j.duration for j in sequence)
-                for m_id in range(1, self.problem.num_machines + 1):
-                    m_free = machine_free_time[m_id]
-                    t0 = max(m_free, 0)
-                    # probeando tiempos desde t0 hasta remaining_horizon
-                    for t_candidate in range(t0, remaining_horizon + 1):
-                        if self._check_resources(t_candidate, job_node.duration, job_node.resource_requirements, resource_timeline):
-                            possible_starts.append((t_candidate, m_id))
-                            break    
-            
-            # Pick best machine (earliest start)
-            possible_starts.sort()
-            start_t, m_id = possible_starts[0]
-            
-            # Assign
-            job_node.start_time = start_t
-            job_node.assigned_machine = m_id
-            solution_jobs.append(job_node)
-            
-            finish_t = start_t + job_node.duration
-            machine_free_time[m_id] = finish_t
-            global_makespan = max(global_makespan, finish_t)
-            
-            # Update structures
-            completion_times.add(finish_t)
-            self._mark_resources_used(start_t, finish_t, job_node.resource_requirements, resource_timeline)
-            
-        return Solution(jobs=solution_jobs, makespan=global_makespan)
-
-    def _check_resources(self, start: int, duration: int, requirements: Dict[int, int], timeline: Dict) -> bool:
-        # Check every time unit? 
-        # CAUTION: If we jump large gaps, checking every unit is still slow (O(Duration)).
-        # But we can optimize: resources change state only at keys of 'timeline'?
-        # In this simple implementation 'timeline' is still discrete t -> usage.
-        # To truly optimize, we should check intervals.
-        # But given the problem constraints (Machine Scheduling usually short to medium horizon), 
-        # and User feedback "skip to next release", the big gain is NOT checking start times 1,2,3,4... 
-        # but jumping t=10, t=50.
-        # Once we pick a candidate T, checking [T, T+dur] linearly is acceptable if Dur is not massive.
-        # If Dur is massive, we need Segment Tree.
-        # Let's keep linear check over duration for now, as User emphasized "Time Jumping" for the SEARCH loop.
-        
-        for t in range(start, start + duration):
-            # If t not in timeline, usage is 0.
-            # Only check if t in timeline to save dict lookups
-            if t in timeline: # Optimization
-                t_usage = timeline[t]
-                for r_id, req_qty in requirements.items():
-                    used = t_usage.get(r_id, 0)
-                    if used + req_qty > self.problem.resources.get(r_id, 0):
-                        return False
-        return True
-
-    def _mark_resources_used(self, start: int, end: int, requirements: Dict[int, int], timeline: Dict):
-        for t in range(start, end):
-            if t not in timeline:
-                timeline[t] = {}
-            for r_id, qty in requirements.items():
-                timeline[t][r_id] = timeline[t].get(r_id, 0) + qty
+        # Index i holds machine i + 1.
+        machine_free_time = [0] * self.problem.num_machines
+        # Resource usage as a step function: it only changes at job starts/ends,
+        # so checks and updates never walk individual time units.
+        profile = ResourceProfile(self._capacities)
+        self._snapshots.append((0, machine_free_time[:], profile.copy(), 0))
+        self._snapshot_positions.append(0)
+        self._decode_from(0, machine_free_time, profile, 0)
+
+    def _resume(self, position: int, new_suffix: List[int]):
+        if not 0 <= position <= len(self._sequence):
+            raise ValueError(f"Position {position} is outside the last decoded sequence (length {len(self._sequence)}).")
+        k = bisect_right(self._snapshot_positions, position) - 1
+        snap_pos, machine_free_time, profile, makespan = self._snapshots[k]
+        self._undo = (k + 1, self._snapshots[k + 1:], self._snapshot_positions[k + 1:],
+                      snap_pos, self._starts[snap_pos:], self._machines[snap_pos:],
+                      position, self._sequence[position:], self._final_makespan)
+        del self._snapshots[k + 1:]
+        del self._snapshot_positions[k + 1:]
+        del self._starts[snap_pos:]
+        del self._machines[snap_pos:]
+        self._sequence[position:] = new_suffix
+        self._decode_from(snap_pos, machine_free_time[:], profile.copy(), makespan)
+
+    def _decode_from(self, position: int, machine_free_time: List[int], profile: ResourceProfile, makespan: int):
+        sequence = self._sequence
+        starts = self._starts
+        machines = self._machines
+        durations = self._durations
+        all_requirements = self._requirements
+        interval = self.checkpoint_interval
+        cumulative = self.machine_mode == 'cumulative'
+
+        for i in range(position, len(sequence)):
+            if interval and i > position and i % interval == 0:
+                self._snapshots.append((i, machine_free_time[:], profile.copy(), makespan))
+                self._snapshot_positions.append(i)
+            idx = sequence[i]
+            duration = durations[idx]
+            requirements = all_requirements[idx]
+
+            if cumulative:
+                start_t = profile.earliest_start(0, duration, requirements)
+                m_id = 0  # handed out by assign_machines
+            else:
+                # Find earliest slot across all machines.
+                # Feasibility of a window does not depend on the machine, so the
+                # earliest start over all machines is the earliest feasible time
+                # after the first machine frees up. The machine is then the lowest
+                # id already free at that time (same tie-break as trying each one).
+                start_t = profile.earliest_start(min(machine_free_time), duration, requirements)
+            if start_t is None:
+                raise ValueError(f"Job {self.problem.jobs[idx].id} requires more of a resource than its capacity.")
+
+            finish_t = start_t + duration
+            if not cumulative:
+                m_idx = 0
+                while machine_free_time[m_idx] > start_t:
+                    m_idx += 1
+                machine_free_time[m_idx] = finish_t
+                m_id = m_idx + 1
+
+            starts.append(start_t)
+            machines.append(m_id)
+            if finish_t > makespan:
+                makespan = finish_t
+            profile.reserve(start_t, finish_t, requirements)
+
+        self._final_makespan = makespan
+
+    def assign_machines(self, jobs: List[Job]):
+        """
+        Hands out machine ids in start-time order. At most num_machines jobs
+        overlap at any time, so the machine that frees up first is always free.
+        """
+        free_heap = [(0, m_id) for m_id in range(1, self.problem.num_machines + 1)]
+        for job in sorted(jobs, key=lambda j: j.start_time):
+            _, m_id = heapq.heappop(free_heap)
+            job.assigned_machine = m_id
+            heapq.heappush(free_heap, (job.start_time + job.duration, m_id))
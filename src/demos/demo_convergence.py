@@ -7,7 +7,7 @@ import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from src.core.generator import generate_instance
-from src.core.model import ProblemInstance, Job
+from src.core.loader import load_problem
 from src.solvers.metaheuristic import GeneticSolver
 from src.solvers.simulated_annealing import SimulatedAnnealingSolver
 from src.utils.advanced_visualizer import AdvancedVisualizer
@@ -17,11 +17,7 @@ def run_demo():
     # Generate one instance
     data = generate_instance(num_jobs=50, num_machines=5, num_resources=3)
     
-    jobs_obj = []
-    for j in data['jobs']:
-        jobs_obj.append(Job(j['id'], j['duration'], {int(k): v for k, v in j['requirements'].items()}))
-    resources = {int(k): v for k, v in data['resources'].items()}
-    problem = ProblemInstance(data['num_machines'], resources, jobs_obj)
+    problem = load_problem(data)
     
     # Run GA
     print("Running GA...")
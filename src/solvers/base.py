@@ -0,0 +1,140 @@
+import threading
+import time
+from typing import Callable, Optional
+from src.core.model import ProblemInstance, Solution
+from src.core.bounds import lower_bound
+from src.core.justification import justify
+
+# on_improvement(solution, elapsed_seconds), called for every new incumbent
+ImprovementCallback = Callable[[Solution, float], None]
+
+
+class CancelToken:
+    """Cooperative cancellation: another thread calls cancel(), the solver polls ``cancelled``."""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+
+class Solver:
+    """
+    Run controls shared by all solvers.
+
+    - time_limit: wall-clock budget in seconds. When it runs out the solver
+      returns its incumbent instead of running to its iteration count.
+    - target_makespan: stop as soon as the incumbent is at or below it (the
+      lower bound of src.core.bounds always acts as a target too).
+    - cancel_token: a CancelToken; cancelling it stops the solver at its next
+      check, again returning the incumbent.
+    - on_improvement: called as on_improvement(solution, elapsed) for every
+      new incumbent.
+    - debug: validate every new incumbent (see ProblemInstance.validate_solution).
+    - justify: run forward-backward justification (src.core.justification)
+      on every new incumbent. The target and lower-bound checks and
+      on_improvement see the justified makespans, and the best justified
+      schedule is returned; the search itself (and any ``history``) keeps
+      working with the unjustified ones.
+
+    After solve(), ``stop_reason`` is None if the solver ran to completion,
+    otherwise one of 'time_limit', 'target', 'lower_bound', 'cancelled' (or a
+    solver-specific limit such as BruteForceSolver's 'max_combinations').
+    Checks are cooperative: solvers poll between moves/generations/candidates.
+    """
+    def __init__(self, problem: ProblemInstance,
+                 time_limit: Optional[float] = None,
+                 target_makespan: Optional[int] = None,
+                 cancel_token: Optional[CancelToken] = None,
+                 on_improvement: Optional[ImprovementCallback] = None,
+                 debug: bool = False,
+                 justify: bool = False):
+        self.problem = problem
+        self.time_limit = time_limit
+        self.target_makespan = target_makespan
+        self.cancel_token = cancel_token
+        self.on_improvement = on_improvement
+        self.debug = debug
+        self.justify = justify
+        self.stop_reason: Optional[str] = None
+        self._started = None
+        self._deadline = None
+        self._justified: Optional[Solution] = None  # Best justified incumbent (justify only)
+
+    def _start(self):
+        """Starts the clock and computes the lower bound; call at the top of solve()."""
+        self._started = time.monotonic()
+        # time.monotonic() is system-wide, so the deadline is also valid in worker processes
+        self._deadline = self._started + self.time_limit if self.time_limit is not None else None
+        self.stop_reason = None
+        self._justified = None
+        self.lower_bound = lower_bound(self.problem)
+
+    @classmethod
+    def for_worker(cls, problem: ProblemInstance, params: dict, deadline: Optional[float]) -> 'Solver':
+        """
+        The solver of a process-pool worker, built once by the pool initializer
+        with the lower bound computed and the parent's deadline attached.
+        Workers check the deadline and the targets themselves; cancel_token and
+        on_improvement stay in the parent process, which acts on them between
+        tasks.
+        """
+        solver = cls(problem, **params)
+        solver._start()
+        solver._deadline = deadline
+        return solver
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self._started if self._started is not None else 0.0
+
+    def _should_stop(self, best_makespan: float) -> bool:
+        """True (and sets stop_reason) once the incumbent or the budget says the run is over."""
+        if self._justified is not None:
+            best_makespan = min(best_makespan, self._justified.makespan)
+        if best_makespan <= self.lower_bound:
+            self.stop_reason = 'lower_bound'
+        elif self.target_makespan is not None and best_makespan <= self.target_makespan:
+            self.stop_reason = 'target'
+        elif self._deadline is not None and time.monotonic() >= self._deadline:
+            self.stop_reason = 'time_limit'
+        elif self.cancel_token is not None and self.cancel_token.cancelled:
+            self.stop_reason = 'cancelled'
+        else:
+            return False
+        return True
+
+    def _improved(self, build: Callable[[], Solution]):
+        """
+        Reports a new incumbent. ``build`` materializes its Solution and is only
+        called when someone needs it (debug, on_improvement or justify). With
+        justify, the incumbent is justified first and only reported if it beats
+        the best justified one so far.
+        """
+        if not self.debug and self.on_improvement is None and not self.justify:
+            return
+        solution = build()
+        if self.debug:
+            self.problem.validate_solution(solution).raise_if_invalid(type(self).__name__)
+        if self.justify:
+            solution = justify(self.problem, solution)
+            if self._justified is not None and solution.makespan >= self._justified.makespan:
+                return
+            self._justified = solution
+        if self.on_improvement is not None:
+            solution.lower_bound = self.lower_bound
+            self.on_improvement(solution, self.elapsed)
+
+    def _finish(self, solution: Optional[Solution]) -> Optional[Solution]:
+        if solution is not None:
+            if self.justify:
+                solution = justify(self.problem, solution)
+                if self._justified is not None and self._justified.makespan < solution.makespan:
+                    solution = self._justified
+            solution.lower_bound = self.lower_bound
+        return solution
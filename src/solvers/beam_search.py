@@ -0,0 +1,203 @@
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+import numpy as np
+from src.core.model import ProblemInstance, Solution
+from src.core.partial_schedule import partial_schedule_data
+from src.core.resource_profile import ResourceProfile
+from src.core.scheduler import SolutionBuilder
+from src.solvers.base import Solver
+from src.solvers.greedy import GreedySolver
+
+# Per-process solver of the expansion pool, created once by _init_expand_worker
+_expand_solver = None
+
+def _init_expand_worker(problem: ProblemInstance, params: dict, deadline: Optional[float]):
+    global _expand_solver
+    _expand_solver = BeamSearchSolver.for_worker(problem, params, deadline)
+    _expand_solver._prepare()
+
+def _expand_chunk(states: List['_BeamState'], offset: int, best_makespan: int) -> tuple:
+    _expand_solver.best_makespan = best_makespan
+    _expand_solver.pruned = 0
+    candidates = []
+    for pos, state in enumerate(states, offset):
+        candidates.extend(_expand_solver._expand(state, pos))
+    return candidates, _expand_solver.pruned
+
+# A child of a beam state: (bound, makespan, parent position, job, start, dominance key)
+Candidate = Tuple[int, int, int, int, int, Tuple]
+
+
+@dataclass
+class _BeamState:
+    """A partial schedule of the serial generation scheme (see BranchAndBoundSolver)."""
+    order: List[int]
+    profile: ResourceProfile
+    unscheduled: int  # Bitmask of the jobs still to place
+    last_start: int
+    last_idx: int
+    makespan: int
+    energy: List[int]  # Work left to place per resource (including the machine pool)
+
+
+class BeamSearchSolver(Solver):
+    """
+    Beam search over partial schedules.
+
+    Partial schedules are those of BranchAndBoundSolver: the machines are one
+    more cumulative resource of capacity m, and a child appends one job at
+    its earliest feasible start, keeping the list sorted by (start, index).
+    Each depth expands every state of the beam and keeps the beam_width
+    children with the lowest bound, then the lowest makespan. The bound is
+    max(makespan, per resource: start + (work left + work booked after the
+    start) / capacity), since no remaining job starts earlier. Children that
+    reach the same frontier (same job set, same usage after the last start)
+    have the same completions and are merged, and children whose bound
+    reaches the incumbent (GreedySolver's schedule, at first) are dropped.
+
+    With branching > 0 a state only keeps its ``branching`` children that
+    start first. With workers > 1 the beam is expanded in a process pool,
+    one chunk of states per worker; the children are then ranked here.
+    """
+    def __init__(self, problem: ProblemInstance,
+                 beam_width: int = 10, # Partial schedules kept per depth
+                 branching: int = 0, # Children per state, earliest start first (0 = all)
+                 workers: int = 1, # >1: expand the beam in a process pool
+                 **controls): # Run controls: time_limit, target_makespan, ... (see Solver)
+        super().__init__(problem, **controls)
+        self.beam_width = max(1, beam_width)
+        self.branching = branching
+        self.workers = workers
+        self.scheduler = SolutionBuilder(problem, machine_mode='cumulative')
+
+    def solve(self) -> Solution:
+        self._start()
+        n = self.problem.compiled.num_jobs
+        incumbent = GreedySolver(self.problem).solve()
+        self.best_makespan = incumbent.makespan
+        self._improved(lambda: incumbent)
+        self.expanded = 0
+        self.merged = 0
+        self.pruned = 0
+        best_order: Optional[List[int]] = None
+
+        if n and not self._should_stop(self.best_makespan):
+            self._prepare()
+            beam = [_BeamState([], ResourceProfile(self._capacities), (1 << n) - 1, 0, -1, 0,
+                               self._remaining_energy[:])]
+            pool = None
+            if self.workers > 1:
+                pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_expand_worker,
+                                           initargs=(self.problem, dict(branching=self.branching), self._deadline))
+            try:
+                for depth in range(n):
+                    candidates = self._expand_beam(beam, pool)
+                    beam = self._select(beam, candidates)
+                    if not beam:
+                        break  # Every child reaches the incumbent
+                    if depth == n - 1:
+                        best = min(beam, key=lambda state: state.makespan)
+                        if best.makespan < self.best_makespan:
+                            self.best_makespan = best.makespan
+                            best_order = best.order
+                            self._improved(lambda: self.scheduler.build_from_indices(best_order))
+                    if self._should_stop(self.best_makespan):
+                        break
+            finally:
+                if pool is not None:
+                    pool.shutdown()
+
+        print(f"Beam search: width {self.beam_width}, {self.expanded} states expanded, {self.merged} merged, "
+              f"{self.pruned} pruned, best {self.best_makespan}")
+        if best_order is None:
+            return self._finish(incumbent)
+        return self._finish(self.scheduler.build_from_indices(best_order))
+
+    def _prepare(self):
+        data = partial_schedule_data(self.problem)
+        self._capacities, self._requirements, self._durations = data.capacities, data.requirements, data.durations
+        self._remaining_energy = data.energy
+        self._twin = data.twin
+
+    def _expand_beam(self, beam: List[_BeamState], pool: Optional[ProcessPoolExecutor]) -> List[Candidate]:
+        self.expanded += len(beam)
+        if pool is None or len(beam) < 2:
+            candidates = []
+            for pos, state in enumerate(beam):
+                candidates.extend(self._expand(state, pos))
+            return candidates
+        bounds = np.linspace(0, len(beam), min(self.workers, len(beam)) + 1).astype(int)
+        futures = [pool.submit(_expand_chunk, beam[lo:hi], lo, self.best_makespan)
+                   for lo, hi in zip(bounds[:-1], bounds[1:])]
+        candidates = []
+        for future in futures:
+            chunk, pruned = future.result()
+            candidates.extend(chunk)
+            self.pruned += pruned
+        return candidates
+
+    def _expand(self, state: _BeamState, pos: int) -> List[Candidate]:
+        """Scored children of one state; those whose bound reaches the incumbent are left out."""
+        durations = self._durations
+        profile = state.profile
+        unscheduled = state.unscheduled
+        children = []
+        for idx in range(len(durations)):
+            if not unscheduled >> idx & 1:
+                continue
+            twin = self._twin[idx]
+            if twin >= 0 and unscheduled >> twin & 1:
+                continue
+            start = profile.earliest_start(state.last_start, durations[idx], self._requirements[idx])
+            if start is None:
+                raise ValueError(f"Job {self.problem.jobs[idx].id} requires more of a resource than its capacity.")
+            if start == state.last_start and idx < state.last_idx:
+                continue  # Same schedule as the list with idx first
+            children.append((start, -durations[idx], idx))
+        children.sort()
+        if self.branching:
+            children = children[:self.branching]
+
+        candidates = []
+        for start, neg_duration, idx in children:
+            finish = start - neg_duration
+            makespan = max(state.makespan, finish)
+            # No remaining job starts before ``start``
+            bound = makespan
+            for r, capacity in enumerate(self._capacities):
+                energy = state.energy[r]
+                if energy:
+                    bound = max(bound, start - (-(energy + profile.energy_from(r, start)) // capacity))
+            if bound >= self.best_makespan:
+                self.pruned += 1
+                continue
+            requirements = self._requirements[idx]
+            profile.reserve(start, finish, requirements)
+            key = (unscheduled & ~(1 << idx), profile.signature_from(start))
+            profile.release(start, finish, requirements)
+            candidates.append((bound, makespan, pos, idx, start, key))
+        return candidates
+
+    def _select(self, beam: List[_BeamState], candidates: List[Candidate]) -> List[_BeamState]:
+        """The beam_width best distinct children, as new states."""
+        candidates.sort(key=lambda candidate: candidate[:5])
+        selected = []
+        seen = set()
+        for bound, makespan, pos, idx, start, key in candidates:
+            if key in seen:
+                self.merged += 1
+                continue
+            seen.add(key)
+            parent = beam[pos]
+            requirements = self._requirements[idx]
+            finish = start + self._durations[idx]
+            profile = parent.profile.copy()
+            profile.reserve(start, finish, requirements)
+            energy = parent.energy[:]
+            for r, qty in requirements:
+                energy[r] -= qty * self._durations[idx]
+            selected.append(_BeamState(parent.order + [idx], profile, key[0], start, idx, makespan, energy))
+            if len(selected) == self.beam_width:
+                break
+        return selected
@@ -0,0 +1,228 @@
+from typing import Dict, List, Optional, Tuple
+from src.core.model import ProblemInstance, Solution
+from src.core.bounds import conflict_cliques
+from src.core.partial_schedule import partial_schedule_data
+from src.core.resource_profile import ResourceProfile
+from src.core.scheduler import SolutionBuilder
+from src.solvers.base import Solver
+from src.solvers.greedy import GreedySolver
+
+# What a node hands its children: (jobs left to place, their earliest starts on
+# the node's partial schedule, finish of the job the child adds)
+ParentState = Tuple[List[int], List[int], float]
+
+
+class BranchAndBoundSolver(Solver):
+    """
+    Exact depth-first branch and bound over partial schedules.
+
+    The identical machines are one more cumulative resource of capacity m (as
+    in SolutionBuilder's 'cumulative' mode), which removes machine symmetry:
+    machine ids are handed out only once the schedule is complete. A node is a
+    partial schedule built by the serial schedule generation scheme; a child
+    appends one unscheduled job at its earliest feasible start. Children must
+    keep the list sorted by (start, job index), so every active schedule (and
+    at least one of them is optimal) is generated exactly once.
+
+    Pruning:
+    - bounds: every remaining job finishes no earlier than its earliest
+      feasible start on the current partial schedule plus its duration. Per
+      resource, if t is the earliest such start of a job using it, the
+      makespan is at least t + (remaining work + work booked after t) / capacity.
+      The remaining jobs of a conflict clique (see src.core.bounds) run one
+      after the other, from the earliest start among them;
+    - dominance: partial schedules with the same job set, last start and
+      resource usage after it have the same completions; only the first one
+      (with the lowest last job index) is expanded;
+    - identical jobs (same duration and requirements) are only scheduled in
+      index order.
+
+    Earliest starts are kept along the branch: a child only recomputes those
+    of the jobs that could have started before its new job finishes, starting
+    from the parent's value; the others cannot have moved.
+
+    The incumbent is seeded with GreedySolver, or with the ``incumbent``
+    given (reported to on_improvement only in the first case). ``optimal`` tells whether the
+    result is proven optimal (complete search, or lower bound reached).
+    """
+    def __init__(self, problem: ProblemInstance,
+                 memo_limit: int = 1_000_000, # Max stored dominance states (0 disables dominance)
+                 incumbent: Optional[Solution] = None, # Starting incumbent (default: GreedySolver's schedule)
+                 **controls): # Run controls: time_limit, target_makespan, ... (see Solver)
+        super().__init__(problem, **controls)
+        self.memo_limit = memo_limit
+        self.incumbent = incumbent
+        self.scheduler = SolutionBuilder(problem, machine_mode='cumulative')
+
+    def solve(self) -> Solution:
+        self._start()
+        compiled = self.problem.compiled
+        n = compiled.num_jobs
+
+        incumbent = self.incumbent
+        if incumbent is None:
+            incumbent = GreedySolver(self.problem).solve()
+            self._improved(lambda: incumbent)
+        self.best_makespan = incumbent.makespan
+        self.best_order: Optional[List[int]] = None
+        self.nodes = 0
+        self.pruned = 0
+        self.optimal = False
+
+        if n and not self._should_stop(self.best_makespan):
+            self._prepare()
+            self._order: List[int] = []
+            self._memo: Dict[Tuple, int] = {}
+            self._stopped = False
+            self._branch((1 << n) - 1, 0, -1, 0, self._root())
+
+        # Reaching the lower bound proves optimality just as a complete search does
+        self.optimal = self.stop_reason in (None, 'lower_bound')
+        print(f"Branch and bound: {self.nodes} nodes, {self.pruned} pruned, "
+              f"best {self.best_makespan} ({'optimal' if self.optimal else self.stop_reason})")
+        if self.best_order is None:
+            return self._finish(incumbent)
+        return self._finish(self.scheduler.build_from_indices(self.best_order))
+
+    def _prepare(self):
+        """Search state shared by all nodes: resources, remaining work, twins, cliques, profile."""
+        data = partial_schedule_data(self.problem)
+        self._capacities, self._requirements, self._durations = data.capacities, data.requirements, data.durations
+        # Work left to schedule per resource (including the machine pool)
+        self._remaining_energy = data.energy
+        self._twin = data.twin
+
+        # Pairwise conflicting jobs run one after the other
+        self._cliques = sorted({tuple(sorted(clique)) for clique in conflict_cliques(self.problem)
+                                if len(clique) > 1})
+        self._profile = ResourceProfile(self._capacities)
+
+    def _root(self) -> ParentState:
+        """Parent state of the empty schedule: every earliest start is computed from 0."""
+        n = len(self._durations)
+        return list(range(n)), [0] * n, float('inf')
+
+    def _branch(self, unscheduled: int, last_start: int, last_idx: int, makespan: int, parent: ParentState):
+        self.nodes += 1
+        if self.nodes % 1024 == 0 and self._should_stop(self.best_makespan):
+            self._stopped = True
+        if self._stopped:
+            return
+
+        if not unscheduled:
+            self._complete(makespan)
+            return
+
+        if self.memo_limit:
+            key = (unscheduled, self._profile.signature_from(last_start))
+            seen = self._memo.get(key)
+            if seen is not None and seen <= last_idx:
+                self.pruned += 1
+                return
+            if seen is not None or len(self._memo) < self.memo_limit:
+                self._memo[key] = last_idx
+
+        found = self._children(unscheduled, last_start, last_idx, makespan, parent)
+        if found is None:
+            return
+        children, remaining, earliest = found
+        for start, finish, idx in children:
+            if finish >= self.best_makespan:
+                continue  # The incumbent improved since the children were listed
+            self._push(idx, start, finish)
+            self._branch(unscheduled & ~(1 << idx), start, idx, max(makespan, finish), (remaining, earliest, finish))
+            self._pop(idx, start, finish)
+            if self._stopped:
+                return
+
+    def _complete(self, makespan: int) -> bool:
+        """A complete schedule (self._order) was reached; True if it is a new incumbent."""
+        if makespan >= self.best_makespan:
+            return False
+        self.best_makespan = makespan
+        self.best_order = self._order[:]
+        self._improved(lambda: self.scheduler.build_from_indices(self.best_order))
+        if self._should_stop(self.best_makespan):
+            self._stopped = True
+        return True
+
+    def _children(self, unscheduled: int, last_start: int, last_idx: int, makespan: int,
+                  parent: ParentState) -> Optional[Tuple[List[Tuple[int, int, int]], List[int], List[int]]]:
+        """
+        (start, finish, job) of every job that may come next, most promising
+        first, with the remaining jobs and their earliest starts; None if the
+        bounds prove no completion beats the incumbent.
+        """
+        durations = self._durations
+        profile = self._profile
+        parent_remaining, parent_earliest, placed_finish = parent
+        remaining = [k for k, idx in enumerate(parent_remaining) if unscheduled >> idx & 1]
+
+        # Lower bounds of every completion of this partial schedule
+        if max(makespan, last_start + max(durations[parent_remaining[k]] for k in remaining)) >= self.best_makespan:
+            self.pruned += 1
+            return None
+
+        children = []
+        earliest = {}
+        # Per resource: earliest start of any remaining job that uses it
+        first_use = [self.best_makespan] * len(self._capacities)
+        for k in remaining:
+            idx = parent_remaining[k]
+            requirements = self._requirements[idx]
+            start = parent_earliest[k]
+            if start < placed_finish:
+                # The new job may be in the way; it cannot make the job start earlier
+                start = profile.earliest_start(max(start, last_start), durations[idx], requirements)
+                if start is None:
+                    raise ValueError(f"Job {self.problem.jobs[idx].id} requires more of a resource than its capacity.")
+            if start + durations[idx] >= self.best_makespan:
+                # Later jobs only push it further back: no completion can improve
+                self.pruned += 1
+                return None
+            earliest[idx] = start
+            for r, _ in requirements:
+                if start < first_use[r]:
+                    first_use[r] = start
+            twin = self._twin[idx]
+            if twin >= 0 and unscheduled >> twin & 1:
+                continue
+            if start == last_start and idx < last_idx:
+                continue  # Same schedule as the list with idx first
+            children.append((start, -durations[idx], idx))
+
+        for clique in self._cliques:
+            members = [idx for idx in clique if unscheduled >> idx & 1]
+            if len(members) > 1:
+                if (min(earliest[idx] for idx in members) + sum(durations[idx] for idx in members)
+                        >= self.best_makespan):
+                    self.pruned += 1
+                    return None
+
+        # Energy: capacity left idle before first_use[r] is lost, the remaining
+        # work and what is already booked after it must fit behind it
+        for r, capacity in enumerate(self._capacities):
+            energy = self._remaining_energy[r]
+            if energy:
+                t = first_use[r]
+                energy += profile.energy_from(r, t)
+                if t - (-energy // capacity) >= self.best_makespan:
+                    self.pruned += 1
+                    return None
+        children.sort()
+        return ([(start, start - neg_duration, idx) for start, neg_duration, idx in children],
+                list(earliest), list(earliest.values()))
+
+    def _push(self, idx: int, start: int, finish: int):
+        requirements = self._requirements[idx]
+        self._profile.reserve(start, finish, requirements)
+        for r, qty in requirements:
+            self._remaining_energy[r] -= qty * self._durations[idx]
+        self._order.append(idx)
+
+    def _pop(self, idx: int, start: int, finish: int):
+        self._order.pop()
+        requirements = self._requirements[idx]
+        for r, qty in requirements:
+            self._remaining_energy[r] += qty * self._durations[idx]
+        self._profile.release(start, finish, requirements)
@@ -1,70 +1,282 @@
-from typing import List, Dict, Tuple, Generator
-from itertools import permutations
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from math import comb, factorial
+from typing import List, Dict, Optional, Tuple
 from src.core.model import ProblemInstance, Solution, Job
+from src.core.resource_profile import ResourceProfile
+from src.solvers.base import Solver
 
-class BruteForceSolver:
-    def __init__(self, problem: ProblemInstance, max_combinations: int = None):
-        self.problem = problem
+# Per-process solver of the shard pool, created once by _init_shard_worker
+_shard_solver = None
+
+def _init_shard_worker(problem: ProblemInstance, params: dict, deadline: Optional[float], best, evaluated, stop):
+    global _shard_solver
+    _shard_solver = BruteForceSolver.for_worker(problem, params, deadline)
+    _shard_solver._shared = (best, evaluated, stop)
+
+def _search_shard(queues: List[List[int]]) -> tuple:
+    return _shard_solver._search_shard(queues)
+
+def count_schedules(n: int, m: int) -> int:
+    """
+    Distinct schedules BruteForceSolver enumerates: the ways to split n jobs
+    into at most m unlabeled, internally ordered queues (sum of Lah numbers
+    L(n, k) = C(n-1, k-1) * n! / k! for k = 1..m).
+    """
+    if n == 0:
+        return 1
+    return sum(comb(n - 1, k - 1) * factorial(n) // factorial(k) for k in range(1, min(n, m) + 1))
+
+
+class BruteForceSolver(Solver):
+    """
+    Exhaustive search over machine queues.
+
+    A schedule is fixed by splitting the jobs into at most m queues (the
+    machines are identical, so queues are unlabeled) and ordering each queue.
+    Jobs are placed one by one, each either at any position of an open queue
+    or at the head of a new one, so every (partition, per-machine order) is
+    generated exactly once. Backtracking edits the queues in place.
+
+    A branch is skipped as soon as some queue's total duration reaches the
+    incumbent, since the jobs of a queue run one after the other. After
+    solve(), ``evaluated`` counts decoded schedules, ``skipped`` pruned
+    branches, ``nodes`` visited placements and ``nodes_per_sec`` the search
+    rate. With max_combinations the search stops after that many schedules
+    (stop_reason 'max_combinations').
+
+    With workers > 1 the tree is cut into shards: every placement of the first
+    few jobs (enough for SHARDS_PER_WORKER shards per worker) becomes a task of
+    a process pool. Workers share the incumbent makespan, the evaluated count
+    and a stop flag through shared memory, so an improvement found in one
+    shard prunes all the others. Each shard still returns the best schedule it
+    found itself, with that schedule's makespan.
+    """
+    SHARDS_PER_WORKER = 4
+
+    def __init__(self, problem: ProblemInstance, max_combinations: int = None,
+                 workers: int = 1, # >1: search shards of the tree in a process pool
+                 **controls): # Run controls: time_limit, target_makespan, ... (see Solver)
+        super().__init__(problem, **controls)
         self.max_combinations = max_combinations
+        self.workers = workers
+        # (best makespan, evaluated count, stop flag) shared by the shard workers
+        self._shared = None
+        compiled = problem.compiled
+        self._durations = compiled.duration_list
+        self._requirements = compiled.requirement_pairs
+        # Longest jobs first: queues fill up early and the load bound bites sooner
+        self._order = sorted(range(compiled.num_jobs), key=lambda idx: -self._durations[idx])
 
     def solve(self) -> Solution:
-        n = len(self.problem.jobs)
-        m = self.problem.num_machines
-        
-        best_sol = None
-        best_makespan = float('inf')
-
-        # 1. Permutamos el orden de los trabajos (n!)
-        for job_order in permutations(self.problem.jobs):
-            
-            # 2. Generamos solo asignaciones ÚNICAS de máquinas (evitando simetría)
-            for assign in self._get_unique_assignments(n, m):
-                
-                machine_queues: Dict[int, List[Job]] = {i: [] for i in range(1, m + 1)}
-                
-                # Asignamos trabajos a máquinas según la partición generada
-                for job, mach in zip(job_order, assign):
-                    machine_queues[mach].append(job)
-
-                sol = self._build_schedule_for_assignment(machine_queues)
-
-                if sol is None:
+        self._start()
+        self._reset()
+        if self.workers > 1:
+            self._solve_sharded()
+        else:
+            self._place(0)
+        self.nodes_per_sec = self.nodes / max(self.elapsed, 1e-9)
+
+        print(f"Brute force: {self.evaluated} schedules evaluated, {self.skipped} branches skipped, "
+              f"{self.nodes} nodes ({self.nodes_per_sec:.0f} nodes/s)")
+        if self._best_queues is None:
+            return Solution(jobs=[], makespan=0, valid=False)
+        return self._finish(self._build_schedule_for_assignment(self._job_queues(self._best_queues)))
+
+    def _reset(self, queues: Optional[List[List[int]]] = None):
+        self._queues: List[List[int]] = queues if queues is not None else []
+        self._loads: List[int] = [sum(self._durations[idx] for idx in queue) for queue in self._queues]
+        self._best_queues = None
+        # Makespan of _best_queues; in a shard worker best_makespan is the shared pruning cutoff instead
+        self._best_queues_makespan = float('inf')
+        self.best_makespan = float('inf')
+        self.evaluated = 0
+        self.skipped = 0
+        self.nodes = 0
+        self._stopped = False
+
+    def _solve_sharded(self):
+        n = len(self._order)
+        depth = 0
+        while depth < n and count_schedules(depth, self.problem.num_machines) < self.workers * self.SHARDS_PER_WORKER:
+            depth += 1
+        shards = list(self._prefixes(depth))
+
+        # No makespan reaches the sum of durations + 1 (every job fits once the others are done)
+        best = mp.Value('q', sum(self._durations) + 1)
+        evaluated = mp.Value('q', 0)
+        stop = mp.Value('b', 0)
+        params = dict(max_combinations=self.max_combinations, target_makespan=self.target_makespan)
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_shard_worker,
+                                 initargs=(self.problem, params, self._deadline, best, evaluated, stop)) as pool:
+            futures = [pool.submit(_search_shard, shard) for shard in shards]
+            done = 0
+            for future in as_completed(futures):
+                if future.cancelled():
                     continue
+                makespan, queues, shard_evaluated, skipped, nodes, reason = future.result()
+                done += 1
+                self.evaluated += shard_evaluated
+                self.skipped += skipped
+                self.nodes += nodes
+                # Compare the shards' own bests: their cutoffs may come from other shards
+                if queues is not None and makespan < self._best_queues_makespan:
+                    self.best_makespan = self._best_queues_makespan = makespan
+                    self._best_queues = queues
+                    self._improved(lambda: self._build_schedule_for_assignment(self._job_queues(queues)))
+                print(f"Shard {done}/{len(shards)}: {self.nodes} nodes "
+                      f"({self.nodes / max(self.elapsed, 1e-9):.0f} nodes/s), best {self.best_makespan}")
+                if not stop.value and (reason is not None or self._should_stop(self.best_makespan)):
+                    if self.stop_reason is None:
+                        self.stop_reason = reason
+                    # Running shards stop at their next schedule and still report their counts
+                    stop.value = 1
+                    for pending in futures:
+                        pending.cancel()
 
-                if sol.makespan < best_makespan:
-                    best_makespan = sol.makespan
-                    best_sol = sol
+    def _prefixes(self, depth: int, placed: int = 0):
+        """Yields a copy of the queues for every placement of the first ``depth`` jobs."""
+        if placed == depth:
+            yield [queue[:] for queue in self._queues]
+            return
+        idx = self._order[placed]
+        queues = self._queues
+        for queue in queues:
+            for pos in range(len(queue) + 1):
+                queue.insert(pos, idx)
+                yield from self._prefixes(depth, placed + 1)
+                del queue[pos]
+        if len(queues) < self.problem.num_machines:
+            queues.append([idx])
+            yield from self._prefixes(depth, placed + 1)
+            queues.pop()
 
-        if best_sol is None:
-            return Solution(jobs=[], makespan=0, valid=False)
-        return best_sol
+    def _search_shard(self, queues: List[List[int]]) -> tuple:
+        """Runs the search below a prefix from _prefixes (in a shard worker)."""
+        self._reset(queues)
+        best = self._shared[0]
+        self.best_makespan = best.value
+        self._place(sum(len(queue) for queue in queues))
+        return self._best_queues_makespan, self._best_queues, self.evaluated, self.skipped, self.nodes, self.stop_reason
+
+    def _place(self, depth: int):
+        """Places self._order[depth:] into the queues, evaluating every complete schedule."""
+        self.nodes += 1
+        if depth == len(self._order):
+            self._evaluate()
+            return
+        idx = self._order[depth]
+        duration = self._durations[idx]
+        queues = self._queues
+        loads = self._loads
+
+        for k in range(len(queues)):
+            if loads[k] + duration >= self.best_makespan:
+                self.skipped += 1
+                continue
+            queue = queues[k]
+            loads[k] += duration
+            for pos in range(len(queue) + 1):
+                queue.insert(pos, idx)
+                self._place(depth + 1)
+                del queue[pos]
+                if self._stopped:
+                    break
+            loads[k] -= duration
+            if self._stopped:
+                return
+
+        # Open a new queue (machines are identical, so one new queue is enough)
+        if len(queues) < self.problem.num_machines:
+            if duration >= self.best_makespan:
+                self.skipped += 1
+                return
+            queues.append([idx])
+            loads.append(duration)
+            self._place(depth + 1)
+            queues.pop()
+            loads.pop()
+
+    def _evaluate(self):
+        self.evaluated += 1
+        if self._shared is not None:
+            best, evaluated, stop = self._shared
+            with evaluated.get_lock():
+                evaluated.value += 1
+                total = evaluated.value
+            # Prune with the incumbent of all workers
+            self.best_makespan = min(self.best_makespan, best.value)
+        else:
+            total = self.evaluated
 
-    def _get_unique_assignments(self, n: int, m: int) -> Generator[Tuple[int, ...], None, None]:
+        makespan = self._queue_makespan(self._queues, self.best_makespan)
+        if makespan is not None and makespan < self.best_makespan:
+            self.best_makespan = makespan
+            self._best_queues_makespan = makespan
+            self._best_queues = [queue[:] for queue in self._queues]
+            best_queues = self._best_queues
+            if self._shared is not None:
+                with best.get_lock():
+                    best.value = min(best.value, makespan)
+            self._improved(lambda: self._build_schedule_for_assignment(self._job_queues(best_queues)))
+        # Proven optimal (the rest cannot improve it), good enough or out of time
+        if self._should_stop(self.best_makespan):
+            self._stopped = True
+        elif self.max_combinations is not None and total >= self.max_combinations:
+            self.stop_reason = 'max_combinations'
+            self._stopped = True
+        elif self._shared is not None and stop.value:
+            self._stopped = True
+
+    def _queue_makespan(self, queues: List[List[int]], cutoff: float) -> Optional[int]:
         """
-        Genera asignaciones de n trabajos a m máquinas idénticas evitando simetrías.
-        Utiliza una técnica de backtracking para generar particiones de un conjunto.
+        Makespan of _build_schedule_for_assignment on index queues, without
+        building Job objects. Returns None when the queues cannot be scheduled
+        or as soon as the makespan reaches ``cutoff``.
         """
-        def backtrack(current_assignment: List[int], max_machine_used: int):
-            if len(current_assignment) == n:
-                yield tuple(current_assignment)
-                return
+        durations = self._durations
+        all_requirements = self._requirements
+        profile = ResourceProfile(self.problem.compiled.capacity_list)
+        heads = [0] * len(queues)
+        machine_free_time = [0] * len(queues)
+        makespan = 0
 
-            # Opción A: Asignar a cualquiera de las máquinas ya "abiertas"
-            for i in range(1, max_machine_used + 1):
-                yield from backtrack(current_assignment + [i], max_machine_used)
-            
-            # Opción B: Abrir una máquina nueva (si no hemos llegado al límite m)
-            if max_machine_used < m:
-                yield from backtrack(current_assignment + [max_machine_used + 1], max_machine_used + 1)
+        for _ in range(len(self._order)):
+            chosen = None
+            for k, queue in enumerate(queues):
+                if heads[k] == len(queue):
+                    continue
+                idx = queue[heads[k]]
+                found = profile.earliest_start(machine_free_time[k], durations[idx], all_requirements[idx])
+                # Ties go to the lowest machine id, as in _build_schedule_for_assignment
+                if found is not None and (chosen is None or found < chosen[0]):
+                    chosen = (found, k, idx)
+            if chosen is None:
+                return None
 
-        yield from backtrack([], 0)
+            start_t, k, idx = chosen
+            finish_t = start_t + durations[idx]
+            if finish_t >= cutoff:
+                return None
+            makespan = max(makespan, finish_t)
+            machine_free_time[k] = finish_t
+            profile.reserve(start_t, finish_t, all_requirements[idx])
+            heads[k] += 1
+        return makespan
+
+    def _job_queues(self, queues: List[List[int]]) -> Dict[int, List[Job]]:
+        jobs = self.problem.jobs
+        machine_queues = {m_id: [] for m_id in range(1, self.problem.num_machines + 1)}
+        for k, queue in enumerate(queues):
+            machine_queues[k + 1] = [jobs[idx] for idx in queue]
+        return machine_queues
 
     def _build_schedule_for_assignment(self, machine_queues: Dict[int, List[Job]]) -> Solution:
         
         machine_free_time = {i: 0 for i in range(1, self.problem.num_machines + 1)}
-        resource_timeline: Dict[int, Dict[int, int]] = {}
+        compiled = self.problem.compiled
+        profile = ResourceProfile(compiled.capacity_list)
         solution_jobs: List[Job] = []
-        completion_times = {0}
         remaining = {i: list(queue) for i, queue in machine_queues.items()}
 
         while any(len(q) > 0 for q in remaining.values()):
@@ -74,18 +286,9 @@ class BruteForceSolver:
                 if not q:
                     continue
                 job = q[0]
-                m_free = machine_free_time[m_id]
-                cand_times = sorted([t for t in completion_times if t >= m_free])
-                if m_free not in completion_times:
-                    cand_times.insert(0, m_free)
-                    cand_times.sort()
-
-                found = -1
-                for t in cand_times:
-                    if self._check_resources(t, job.duration, job.resource_requirements, resource_timeline):
-                        found = t
-                        break
-                if found != -1:
+                requirements = compiled.requirement_pairs[compiled.job_index[job.id]]
+                found = profile.earliest_start(machine_free_time[m_id], job.duration, requirements)
+                if found is not None:
                     candidates.append((found, m_id, job))
 
             if not candidates:
@@ -105,27 +308,9 @@ class BruteForceSolver:
 
             finish_t = start_t + job_node.duration
             machine_free_time[chosen_m] = finish_t
-            completion_times.add(finish_t)
-            self._mark_resources_used(start_t, finish_t, job_node.resource_requirements, resource_timeline)
+            profile.reserve(start_t, finish_t, compiled.requirement_pairs[compiled.job_index[chosen_job.id]])
 
             remaining[chosen_m].pop(0)
 
         makespan = max((j.start_time + j.duration) for j in solution_jobs) if solution_jobs else 0
         return Solution(jobs=solution_jobs, makespan=makespan, valid=True)
-
-    def _check_resources(self, start: int, duration: int, requirements: Dict[int, int], timeline: Dict) -> bool:
-        for t in range(start, start + duration):
-            if t in timeline:
-                t_usage = timeline[t]
-                for r_id, req_qty in requirements.items():
-                    used = t_usage.get(r_id, 0)
-                    if used + req_qty > self.problem.resources.get(r_id, 0):
-                        return False
-        return True
-
-    def _mark_resources_used(self, start: int, end: int, requirements: Dict[int, int], timeline: Dict):
-        for t in range(start, end):
-            if t not in timeline:
-                timeline[t] = {}
-            for r_id, qty in requirements.items():
-                timeline[t][r_id] = timeline[t].get(r_id, 0) + qty
\ No newline at end of file
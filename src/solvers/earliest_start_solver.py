@@ -1,110 +1,125 @@
-from typing import List, Dict, Tuple, Optional
+import heapq
+from typing import List, Dict, Tuple
+import numpy as np
 from src.core.model import ProblemInstance, Solution, Job
-from src.core.scheduler import SolutionBuilder
+from src.solvers.base import Solver
 
-class EarliestStartSolver:
+class EarliestStartSolver(Solver):
     """
     Solver that iteratively places the job that can start at the earliest time among
-    all not-yet-assigned jobs. Ties are broken arbitrarily (first encountered).
-
-    Algorithm (per iteration):
-    - For each unassigned job compute its earliest feasible (start_time, machine)
-      using event-based candidate times (completion times and machine free times)
-      and a small fallback search up to the latest machine-free time.
-    - Select the job with minimal earliest start and place it; update data structures.
-    - Repeat until all jobs are assigned.
+    all not-yet-assigned jobs. Ties go to the lowest job index, then the lowest machine id.
+
+    Placing a job only adds machine and resource usage, so no job's earliest start
+    ever moves back and the chosen starts never decrease. The solver is therefore an
+    event sweep over the current time t (0 or a completion time):
+    - Every running job has started by t, so usage only drops after t and a job fits
+      at t iff its demand fits the free capacity at t and a machine is free; its
+      duration does not matter.
+    - While a machine is free, the lowest-index job that fits is placed at t, on the
+      lowest machine id free by t. Jobs that did not fit at t cannot fit after a
+      placement at t either, so only the remaining candidates are rechecked.
+      Jobs with the same demand fit together, so the checks run once per demand
+      class, on the class's lowest pending index.
+    - Otherwise t moves to the next completion (a heap of running jobs), which
+      releases its machine and resources.
+    This picks exactly the job and machine a full rescan of every job's earliest
+    start would, at the cost of one vectorized check over the demand classes per event.
     """
 
-    def __init__(self, problem: ProblemInstance):
-        self.problem = problem
-        self.builder = SolutionBuilder(problem)
+    def __init__(self, problem: ProblemInstance, **controls): # Run controls: time_limit, target_makespan, ... (see Solver)
+        super().__init__(problem, **controls)
 
     def solve(self) -> Solution:
-        # state similar to SolutionBuilder.build_from_sequence
-        machine_free_time: Dict[int, int] = {i: 0 for i in range(1, self.problem.num_machines + 1)}
-        resource_timeline: Dict[int, Dict] = {}  # t -> {r_id -> qty}
-        completion_times = {0}
+        # Constructive single pass: the run controls only report the final schedule
+        self._start()
+        compiled = self.problem.compiled
+        machine_ids = range(1, self.problem.num_machines + 1)
+        machine_free_time: Dict[int, int] = {i: 0 for i in machine_ids}
+        durations = compiled.duration_list
+        demand = compiled.demand
 
-        unassigned: List[Job] = [job for job in self.problem.jobs]
         assigned_jobs: List[Job] = []
         global_makespan = 0
 
         # Quick feasibility check: any job requiring more than capacity -> impossible
-        for job in unassigned:
-            for r_id, qty in job.resource_requirements.items():
-                cap = self.problem.resources.get(r_id, 0)
+        for j in range(compiled.num_jobs):
+            for r, qty in compiled.requirement_pairs[j]:
+                cap = compiled.capacity_list[r]
                 if qty > cap:
-                    raise ValueError(f"Job {job.id} requires {qty} of resource {r_id}, but capacity is {cap}.")
-
-        while unassigned:
-            # For each unassigned job, compute earliest feasible (start, machine).
-            earliest_for_job: List[Tuple[int, int, Job]] = []  # (start_time, machine_id, job)
-
-            current_candidates = sorted(list(completion_times))
-            latest_machine_free = max(machine_free_time.values())
-
-            for job in unassigned:
-                found_pair: Optional[Tuple[int, int]] = None
-
-                # Try event-based candidates for each machine
-                best_start_for_this_job = None
-                best_machine_for_this_job = None
-
-                for m_id in range(1, self.problem.num_machines + 1):
-                    m_free = machine_free_time[m_id]
-                    valid_candidates = [t for t in current_candidates if t >= m_free]
-                    if m_free not in current_candidates:
-                        # ensure we try starting at machine free time as well
-                        valid_candidates.insert(0, m_free)
-                        valid_candidates.sort()
-
-                    found_t = -1
-                    for t in valid_candidates:
-                        if self.builder._check_resources(t, job.duration, job.resource_requirements, resource_timeline):
-                            found_t = t
+                    raise ValueError(f"Job {compiled.job_ids[j]} requires {qty} of resource {compiled.resource_keys[r]}, but capacity is {cap}.")
+
+        # Jobs with the same demand fit at the same times, so the fit checks run per
+        # demand class, and each class offers its lowest pending job index (its head).
+        # Zero-duration jobs hold no resources, they only need a free machine.
+        n = compiled.num_jobs
+        keys = np.column_stack([demand, compiled.durations <= 0])
+        classes, class_of = np.unique(keys, axis=0, return_inverse=True)
+        class_rows = np.ascontiguousarray(classes[:, :-1].T)  # demand per resource, one column per class
+        class_instant = classes[:, -1].astype(bool)
+        class_of = class_of.ravel()
+        members = np.split(np.argsort(class_of, kind='stable'), np.cumsum(np.bincount(class_of))[:-1]) if n else []
+        heads = np.array([jobs[0] for jobs in members], dtype=np.int64)  # n once a class is used up
+        taken = [0] * len(members)
+
+        free = compiled.capacities.copy()  # free capacity at t
+        num_pending = n
+        running: List[Tuple[int, int]] = []  # (finish time, job index)
+        t = 0
+        self.events = 0
+
+        while num_pending:
+            self.events += 1
+            while running and running[0][0] <= t:
+                _, j = heapq.heappop(running)
+                free += demand[j]
+
+            if min(machine_free_time.values()) <= t:
+                candidates = np.flatnonzero((heads < n) & self._fits(class_rows, class_instant, free))
+                while candidates.size:
+                    c = candidates[heads[candidates].argmin()]
+                    chosen = int(heads[c])
+                    taken[c] += 1
+                    heads[c] = members[c][taken[c]] if taken[c] < len(members[c]) else n
+                    chosen_m = next(m_id for m_id in machine_ids if machine_free_time[m_id] <= t)
+                    chosen_job = self.problem.jobs[chosen]
+
+                    # Assign chosen job
+                    job_node = Job(
+                        id=chosen_job.id,
+                        duration=chosen_job.duration,
+                        resource_requirements=chosen_job.resource_requirements
+                    )
+                    job_node.start_time = t
+                    job_node.assigned_machine = chosen_m
+                    assigned_jobs.append(job_node)
+                    num_pending -= 1
+
+                    finish_t = t + durations[chosen]
+                    machine_free_time[chosen_m] = finish_t
+                    global_makespan = max(global_makespan, finish_t)
+                    if finish_t > t:
+                        free -= demand[chosen]
+                        heapq.heappush(running, (finish_t, chosen))
+                        if min(machine_free_time.values()) > t:
                             break
 
-                    # fallback: scan forward until latest_machine_free (inclusive)
-                    if found_t == -1:
-                        t0 = max(m_free, 0)
-                        for t_candidate in range(t0, latest_machine_free + 1):
-                            if self.builder._check_resources(t_candidate, job.duration, job.resource_requirements, resource_timeline):
-                                found_t = t_candidate
-                                break
-
-                    if found_t != -1:
-                        if best_start_for_this_job is None or found_t < best_start_for_this_job:
-                            best_start_for_this_job = found_t
-                            best_machine_for_this_job = m_id
-
-                if best_start_for_this_job is not None:
-                    earliest_for_job.append((best_start_for_this_job, best_machine_for_this_job, job))
-                else:
-                    # Shouldn't happen because latest_machine_free is a safe upper bound
-                    raise RuntimeError(f"No feasible start found for job {job.id} within considered horizon.")
-
-            # Choose job with minimal earliest start (ties: first found)
-            earliest_for_job.sort(key=lambda x: x[0])
-            start_t, chosen_m, chosen_job = earliest_for_job[0]
-
-            # Assign chosen job
-            job_node = Job(
-                id=chosen_job.id,
-                duration=chosen_job.duration,
-                resource_requirements=chosen_job.resource_requirements
-            )
-            job_node.start_time = start_t
-            job_node.assigned_machine = chosen_m
-
-            assigned_jobs.append(job_node)
-            finish_t = start_t + job_node.duration
-            machine_free_time[chosen_m] = finish_t
-            global_makespan = max(global_makespan, finish_t)
-
-            completion_times.add(finish_t)
-            self.builder._mark_resources_used(start_t, finish_t, job_node.resource_requirements, resource_timeline)
-
-            # remove from unassigned
-            unassigned = [j for j in unassigned if j.id != chosen_job.id]
-
-        return Solution(jobs=assigned_jobs, makespan=global_makespan)
+                    candidates = candidates[(heads[candidates] < n)
+                                            & self._fits(class_rows[:, candidates], class_instant[candidates], free)]
+
+            if running:
+                t = running[0][0]
+            elif num_pending:
+                # Shouldn't happen because capacities were checked above (needs a machine, though)
+                raise RuntimeError("No feasible start found for the remaining jobs within considered horizon.")
+
+        solution = Solution(jobs=assigned_jobs, makespan=global_makespan)
+        self._improved(lambda: solution)
+        return self._finish(solution)
+
+    @staticmethod
+    def _fits(class_rows: np.ndarray, instant: np.ndarray, free: np.ndarray) -> np.ndarray:
+        """Classes (columns of class_rows) whose demand fits the free capacity, one comparison per resource."""
+        fits = np.ones(class_rows.shape[1], dtype=bool)
+        for r, level in enumerate(free):
+            fits &= class_rows[r] <= level
+        return fits | instant
@@ -1,42 +1,209 @@
-from typing import List, Dict
+import math
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import List, Dict, Optional, Tuple
+import numpy as np
 from src.core.model import ProblemInstance, Solution, Job
 from src.core.scheduler import SolutionBuilder
+from src.solvers.base import Solver
 
-class GreedySolver:
-    def __init__(self, problem: ProblemInstance):
-        self.problem = problem
-        self.scheduler = SolutionBuilder(problem)
+# Per-process solver of the GRASP pool, created once by _init_grasp_worker
+_grasp_solver = None
+
+def _init_grasp_worker(problem: ProblemInstance, params: dict, deadline: Optional[float]):
+    global _grasp_solver
+    _grasp_solver = GreedySolver.for_worker(problem, params, deadline)
+
+def _grasp_batch(seeds: List[int]) -> tuple:
+    return _grasp_solver._grasp_batch(seeds)
+
+
+class GreedySolver(Solver):
+    """
+    List scheduling with fixed priority rules, plus an optional GRASP mode.
+
+    With restarts > 0 the fixed rules only give the first incumbent. Each
+    restart then draws random weights for the rules, ranks the jobs by the
+    weighted sum of the (normalized) rule keys and builds a sequence from a
+    restricted candidate list: the next job is picked uniformly among the
+    rcl_size best-ranked jobs not placed yet. With local_search > 0 every
+    sequence is then polished by that many sampled swap/insert moves, keeping
+    those that do not make it worse.
+
+    Restarts are seeded from the global ``random`` module, so a seed gives the
+    same restarts in serial and pool mode. With workers > 1 they run in a
+    process pool, in batches of about restarts / (workers * BATCHES_PER_WORKER).
+    """
+    RULES = ('LPT', 'SPT', 'HeavyResource', 'MostTotalResources')
+    BATCHES_PER_WORKER = 4
+
+    def __init__(self, problem: ProblemInstance,
+                 restarts: int = 0, # >0: GRASP, randomized restarts after the fixed rules
+                 rcl_size: int = 3, # Restricted candidate list: best-ranked jobs the next one is drawn from
+                 local_search: int = 0, # Sampled swap/insert moves that polish each restart (0 = off)
+                 workers: int = 1, # >1: run the restarts in a process pool
+                 **controls): # Run controls: time_limit, target_makespan, ... (see Solver)
+        super().__init__(problem, **controls)
+        self.restarts = restarts
+        self.rcl_size = max(1, rcl_size)
+        self.local_search = local_search
+        self.workers = workers
+        self._keys: Optional[np.ndarray] = None
+        # Checkpoints let a local-search move re-decode only from min(i, j) onwards
+        interval = max(1, math.isqrt(len(problem.jobs))) if restarts and local_search else 0
+        self.scheduler = SolutionBuilder(problem, checkpoint_interval=interval)
 
     def solve(self, sort_strategy: str = None) -> Solution:
         """
         Solves using List Scheduling.
         If sort_strategy is provided, uses that specific one.
-        If not, tries multiple strategies and picks the best.
+        If not, tries multiple strategies and picks the best, then runs the
+        GRASP restarts if enabled.
         """
-        
+
         strategies = []
         if sort_strategy:
             strategies.append(sort_strategy)
         else:
-            strategies = ['LPT', 'SPT', 'HeavyResource', 'MostTotalResources']
+            strategies = list(self.RULES)
 
         best_solution = None
         best_makespan = float('inf')
-        
-        print(f"Greedy Solver trying strategies: {strategies}")
+
+        if self.debug:
+            print(f"Greedy Solver trying strategies: {strategies}")
+        self._start()
+        self.grasp_history: List[int] = []  # Makespan of every GRASP restart, in completion order
 
         for strat in strategies:
             # Sort jobs
             jobs_ordered = self._sort_jobs(self.problem.jobs[:], strat)
-            
+
             # Build schedule
             sol = self.scheduler.build_from_sequence(jobs_ordered)
-            
+
             if sol.makespan < best_makespan:
                 best_makespan = sol.makespan
                 best_solution = sol
-        
-        return best_solution
+                self._improved(lambda: sol)
+            if self._should_stop(best_makespan):
+                break # Optimal, good enough or out of time: skip the remaining strategies
+
+        if not sort_strategy and self.restarts > 0 and self.stop_reason is None and self.problem.jobs:
+            best_sequence = self._solve_grasp(best_makespan)
+            if best_sequence is not None:
+                best_solution = self.scheduler.build_from_indices(best_sequence)
+
+        return self._finish(best_solution)
+
+    def _solve_grasp(self, best_makespan: int) -> Optional[List[int]]:
+        """Runs the restarts; returns the best sequence if one beats ``best_makespan``."""
+        seeds = [random.getrandbits(64) for _ in range(self.restarts)]
+        best_sequence = None
+        if self.workers > 1:
+            size = max(1, -(-len(seeds) // (self.workers * self.BATCHES_PER_WORKER)))
+            batches = [seeds[k:k + size] for k in range(0, len(seeds), size)]
+            params = dict(rcl_size=self.rcl_size, local_search=self.local_search, restarts=self.restarts,
+                          target_makespan=self.target_makespan)
+            with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_grasp_worker,
+                                     initargs=(self.problem, params, self._deadline)) as pool:
+                futures = [pool.submit(_grasp_batch, batch) for batch in batches]
+                for future in as_completed(futures):
+                    if future.cancelled():
+                        continue
+                    makespan, sequence, history = future.result()
+                    self.grasp_history.extend(history)
+                    if makespan < best_makespan:
+                        best_makespan, best_sequence = makespan, sequence
+                        self._improved(lambda: self.scheduler.build_from_indices(sequence))
+                    if self._should_stop(best_makespan):
+                        for pending in futures:
+                            pending.cancel()
+        else:
+            for seed in seeds:
+                makespan, sequence = self._grasp_restart(seed)
+                self.grasp_history.append(makespan)
+                if makespan < best_makespan:
+                    best_makespan, best_sequence = makespan, sequence
+                    self._improved(self.scheduler.to_solution)
+                if self._should_stop(best_makespan):
+                    break
+
+        if self.debug:
+            print(f"GRASP: {len(self.grasp_history)}/{self.restarts} restarts, best {best_makespan}"
+                  + (f" ({self.stop_reason})" if self.stop_reason else ""))
+        return best_sequence
+
+    def _grasp_batch(self, seeds: List[int]) -> Tuple[float, Optional[List[int]], List[int]]:
+        """Pool side: runs restarts until the batch, the deadline or a target ends it."""
+        best_makespan, best_sequence = float('inf'), None
+        history = []
+        for seed in seeds:
+            makespan, sequence = self._grasp_restart(seed)
+            history.append(makespan)
+            if makespan < best_makespan:
+                best_makespan, best_sequence = makespan, sequence
+            if self._should_stop(best_makespan):
+                break
+        return best_makespan, best_sequence, history
+
+    def _grasp_restart(self, seed: int) -> Tuple[int, List[int]]:
+        """One randomized construction (plus local search); returns (makespan, sequence)."""
+        rng = random.Random(seed)
+        # Random convex combination of the rules (uniform over the simplex)
+        weights = np.array([-math.log(1.0 - rng.random()) for _ in self.RULES])
+        scores = self._rule_keys() @ (weights / weights.sum())
+        ranked = np.argsort(-scores, kind='stable').tolist()
+
+        # Restricted candidate list: the rcl_size best-ranked jobs not placed yet
+        sequence = []
+        rcl = ranked[:self.rcl_size]
+        upcoming = iter(ranked[self.rcl_size:])
+        while rcl:
+            sequence.append(rcl.pop(rng.randrange(len(rcl))))
+            nxt = next(upcoming, None)
+            if nxt is not None:
+                rcl.append(nxt)
+
+        makespan = self.scheduler.evaluate_makespan(sequence)
+        if self.local_search and len(sequence) >= 2:
+            makespan = self._polish(sequence, makespan, rng)
+        return makespan, sequence
+
+    def _polish(self, sequence: List[int], makespan: int, rng: random.Random) -> int:
+        """Sampled swap/insert descent on ``sequence`` (in place), sideways moves allowed."""
+        n = len(sequence)
+        for k in range(self.local_search):
+            if k % 64 == 0 and self._should_stop(makespan):
+                break
+            i, j = rng.sample(range(n), 2)
+            neighbor = sequence[:]
+            if k % 2 == 0:
+                neighbor[i], neighbor[j] = neighbor[j], neighbor[i]
+            else:
+                neighbor.insert(j, neighbor.pop(i))
+            candidate = self.scheduler.evaluate_makespan(neighbor, position=min(i, j))
+            if candidate <= makespan:
+                sequence[:] = neighbor
+                makespan = candidate
+            else:
+                self.scheduler.revert()
+        return makespan
+
+    def _rule_keys(self) -> np.ndarray:
+        """(n x rules) priority keys, larger = earlier, each scaled to [0, 1]."""
+        if self._keys is None:
+            compiled = self.problem.compiled
+            durations = compiled.durations.astype(float)
+            keys = np.column_stack([
+                durations,  # LPT
+                -durations,  # SPT
+                [len(job.resource_requirements) for job in self.problem.jobs],  # HeavyResource
+                compiled.demand.sum(axis=1),  # MostTotalResources
+            ]).astype(float)
+            spread = keys.max(axis=0) - keys.min(axis=0)
+            self._keys = (keys - keys.min(axis=0)) / np.where(spread > 0, spread, 1.0)
+        return self._keys
 
     def _sort_jobs(self, jobs: List[Job], strategy: str) -> List[Job]:
         if strategy == 'LPT':
@@ -0,0 +1,173 @@
+import bisect
+import heapq
+import random
+from typing import Dict, List, Tuple
+from src.core.model import ProblemInstance, Solution
+from src.core.resource_profile import ResourceProfile
+from src.core.scheduler import SolutionBuilder
+from src.solvers.base import Solver
+from src.solvers.greedy import GreedySolver
+
+
+class LNSSolver(Solver):
+    """
+    Large neighbourhood search on a partial schedule.
+
+    The current schedule is kept as start times plus the ResourceProfile they
+    load, with the machines as one more cumulative resource of capacity m (as
+    in SolutionBuilder's 'cumulative' mode). Every iteration destroys
+    ``destroy_size`` jobs, i.e. releases their usage, and repairs by placing
+    them again, longest first, at their earliest feasible start with every
+    other job fixed: the builder's placement rule, without decoding the rest
+    of the schedule. An iteration costs O(k log n) plus the profile walk over
+    the repaired window.
+
+    Destroy operators ('mixed' draws one per iteration):
+    - 'window': the jobs starting closest to a random time, drawn towards
+      the end of the schedule, where the makespan is decided.
+    - 'resource': the same, among the jobs using one resource, drawn in
+      proportion to its load (the machine pool counts as a resource).
+    - 'random': any k jobs.
+    Repaired jobs are searched from the earliest start among the destroyed
+    ones. A repair is kept if (makespan, sum of completion times) does not
+    get worse, so jobs keep moving earlier on makespan plateaus; otherwise
+    it is undone.
+    """
+    OPERATORS = ('window', 'resource', 'random')
+
+    def __init__(self, problem: ProblemInstance,
+                 max_iter: int = 10000,
+                 destroy_size: int = 8, # Jobs removed and reinserted per iteration
+                 operator: str = 'mixed', # 'window', 'resource', 'random' or 'mixed'
+                 **controls): # Run controls: time_limit, target_makespan, ... (see Solver)
+        super().__init__(problem, **controls)
+        if operator != 'mixed' and operator not in self.OPERATORS:
+            raise ValueError(f"Unknown operator '{operator}', use one of {self.OPERATORS} or 'mixed'.")
+        self.max_iter = max_iter
+        self.destroy_size = destroy_size
+        self.operator = operator
+        self.scheduler = SolutionBuilder(problem, machine_mode='cumulative')
+
+        compiled = problem.compiled
+        self._durations = compiled.duration_list
+        self._capacities, self._requirements = compiled.with_machine_pool()
+        # Load (work / capacity) of every resource, the bias of the 'resource' operator
+        load = [0.0] * len(self._capacities)
+        for idx, requirements in enumerate(self._requirements):
+            for r, qty in requirements:
+                load[r] += qty * self._durations[idx] / self._capacities[r]
+        self._load = load
+
+    def solve(self) -> Solution:
+        self._start()
+        n = len(self.problem.jobs)
+        incumbent = GreedySolver(self.problem).solve()
+        self._improved(lambda: incumbent)
+        self.history: List[int] = []
+        self.accepted = 0
+        self.operator_wins: Dict[str, int] = {name: 0 for name in self.OPERATORS}
+        if n < 2 or self._should_stop(incumbent.makespan):
+            return self._finish(incumbent)
+
+        # Load the incumbent (a dedicated-machine schedule is also feasible here)
+        index = self.problem.compiled.job_index
+        self._profile = ResourceProfile(self._capacities)
+        self._starts = [0] * n
+        self._by_start: List[Tuple[int, int]] = []
+        # Per resource, the (start, idx) of the jobs using it; the pool's list is _by_start
+        self._by_resource: List[List[Tuple[int, int]]] = [[] for _ in self._capacities]
+        self._by_resource[-1] = self._by_start
+        self._finishes: List[Tuple[int, int]] = []  # max-heap of (-finish, idx), stale entries skipped
+        self._total_finish = 0
+        for job in incumbent.jobs:
+            self._place(index[job.id], job.start_time)
+
+        makespan = self._makespan()
+        best_makespan = makespan
+        best_starts = self._starts[:]
+        for iteration in range(self.max_iter):
+            if self._should_stop(best_makespan):
+                break
+            operator = self.operator if self.operator != 'mixed' else random.choice(self.OPERATORS)
+            removed = self._destroy(operator, makespan)
+            old_starts = [self._starts[idx] for idx in removed]
+            old_total = self._total_finish
+            for idx in removed:
+                self._unplace(idx)
+
+            # Repair: longest first, each at its earliest start with the others fixed
+            floor = min(old_starts)
+            for idx in sorted(removed, key=lambda i: -self._durations[i]):
+                self._place(idx, self._profile.earliest_start(floor, self._durations[idx], self._requirements[idx]))
+
+            new_makespan = self._makespan()
+            if (new_makespan, self._total_finish) <= (makespan, old_total):
+                self.accepted += 1
+                if new_makespan < makespan:
+                    self.operator_wins[operator] += 1
+                makespan = new_makespan
+                if makespan < best_makespan:
+                    best_makespan = makespan
+                    best_starts = self._starts[:]
+                    self._improved(lambda: self.scheduler.solution_from_starts(best_starts))
+            else:
+                for idx in removed:
+                    self._unplace(idx)
+                for idx, start in zip(removed, old_starts):
+                    self._place(idx, start)
+
+            self.history.append(best_makespan)
+            if iteration % 1000 == 0:
+                print(f"Iter {iteration}: Current {makespan}, Best {best_makespan}")
+
+        if best_makespan >= incumbent.makespan:
+            return self._finish(incumbent)
+        return self._finish(self.scheduler.solution_from_starts(best_starts))
+
+    def _destroy(self, operator: str, makespan: int) -> List[int]:
+        k = min(self.destroy_size, len(self._starts))
+        if operator == 'random':
+            return random.sample(range(len(self._starts)), k)
+        if operator == 'resource':
+            r = random.choices(range(len(self._capacities)), weights=self._load)[0]
+            jobs = self._by_resource[r]
+            if len(jobs) < k:
+                jobs = self._by_start
+        else:
+            jobs = self._by_start
+        # The k jobs starting closest to a time drawn with density growing towards the end
+        t = int(makespan * random.random() ** 0.5)
+        i = bisect.bisect_left(jobs, (t, -1))
+        lo = max(0, min(i - k // 2, len(jobs) - k))
+        return [idx for _, idx in jobs[lo:lo + k]]
+
+    def _place(self, idx: int, start: int):
+        finish = start + self._durations[idx]
+        self._starts[idx] = start
+        self._profile.reserve(start, finish, self._requirements[idx])
+        for r, _ in self._requirements[idx]:
+            bisect.insort(self._by_resource[r], (start, idx))
+        heapq.heappush(self._finishes, (-finish, idx))
+        self._total_finish += finish
+
+    def _unplace(self, idx: int):
+        start = self._starts[idx]
+        finish = start + self._durations[idx]
+        self._profile.release(start, finish, self._requirements[idx])
+        for r, _ in self._requirements[idx]:
+            jobs = self._by_resource[r]
+            del jobs[bisect.bisect_left(jobs, (start, idx))]
+        self._starts[idx] = None
+        self._total_finish -= finish
+
+    def _makespan(self) -> int:
+        finishes = self._finishes
+        starts = self._starts
+        durations = self._durations
+        # Skip entries of jobs that were moved (or are being moved) since they were pushed
+        while starts[finishes[0][1]] is None or starts[finishes[0][1]] + durations[finishes[0][1]] != -finishes[0][0]:
+            heapq.heappop(finishes)
+        if len(finishes) > 4 * len(starts):
+            self._finishes = [(-(start + durations[idx]), idx) for idx, start in enumerate(starts)]
+            heapq.heapify(self._finishes)
+        return -self._finishes[0][0]
@@ -1,147 +1,348 @@
+import math
 import random
-from typing import List, Tuple
-from src.core.model import ProblemInstance, Solution, Job
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+import numpy as np
+from src.core.model import ProblemInstance, Solution
 from src.core.scheduler import SolutionBuilder
+from src.core.fitness_cache import FitnessCache
+from src.solvers.base import Solver
+
+# Per-process solver of the evaluation pool, created once by _init_worker
+_worker_solver = None
+
+def _init_worker(problem: ProblemInstance, params: dict, deadline: Optional[float]):
+    global _worker_solver
+    _worker_solver = GeneticSolver.for_worker(problem, params, deadline)
+
+def _evaluate_chunk(perms: np.ndarray) -> List[int]:
+    return _worker_solver.scheduler.evaluate_batch(perms).tolist()
+
+# Per-process solver of the island pool, created once by _init_island_worker
+_island_solver = None
+
+def _init_island_worker(problem: ProblemInstance, params: dict, deadline: Optional[float]):
+    global _island_solver
+    _island_solver = GeneticSolver.for_worker(problem, params, deadline)
+
+def _evolve_island(island: '_Island', generations: int) -> '_Island':
+    _island_solver._evolve(island, generations, verbose=False)
+    return island
+
+@dataclass
+class _Island:
+    """One population and its search state; the whole run in serial mode."""
+    population: np.ndarray  # (size x n) int32, one permutation of job indices per row
+    rng: np.random.Generator
+    mutation_rate: float
+    crossover_rate: float
+    best_makespan: float = float('inf')
+    best_sequence: Optional[np.ndarray] = None
+    stall: int = 0  # Generations without improvement
+    generation: int = 0
+    elites: Optional[np.ndarray] = None  # Best rows of the last evaluated generation
+    history: List[int] = field(default_factory=list)
+    history_avg: List[float] = field(default_factory=list)
+
+class GeneticSolver(Solver):
+    """
+    Permutation GA over job orders. The population is one int32 matrix (a row
+    per individual, entries are indices into problem.jobs) and selection,
+    OX crossover and mutation are vectorized over all rows. Random numbers
+    come from a NumPy Generator seeded from the global ``random`` module, so
+    random.seed() still makes runs reproducible.
+    """
+    MUTATION_OPERATORS = ('swap', 'insert', 'both')
 
-class GeneticSolver:
     def __init__(self, problem: ProblemInstance, 
                  pop_size: int = 100, 
                  generations: int = 300, 
                  mutation_rate: float = 0.25,
                  crossover_rate: float = 0.9,
-                 restart_threshold: int = 40): # Restart if no improvement for X gens
-        self.problem = problem
+                 restart_threshold: int = 40, # Restart if no improvement for X gens
+                 machine_mode: str = 'dedicated', # See SolutionBuilder.MACHINE_MODES
+                 workers: int = 1, # >1: evaluate the population in a process pool
+                 cache_size: int = 10000, # Makespans of recently seen permutations (0 disables)
+                 islands: int = 1, # >1: island model, one process per sub-population
+                 migration_interval: int = 20, # Generations between migrations
+                 migration_size: int = 2, # Elites each island sends to the next one
+                 island_rates: Optional[List[Tuple[float, float]]] = None, # (mutation, crossover) per island
+                 mutation_operator: str = 'swap', # 'swap', 'insert' or 'both' (one of them at random)
+                 **controls): # Run controls: time_limit, target_makespan, ... (see Solver)
+        if mutation_operator not in self.MUTATION_OPERATORS:
+            raise ValueError(f"Unknown mutation_operator '{mutation_operator}'. Expected one of {self.MUTATION_OPERATORS}.")
+        super().__init__(problem, **controls)
         self.pop_size = pop_size
         self.generations = generations
         self.mutation_rate = mutation_rate
         self.crossover_rate = crossover_rate
         self.restart_threshold = restart_threshold
+        self.machine_mode = machine_mode
+        self.workers = workers
+        self.islands = islands
+        self.migration_interval = migration_interval
+        self.migration_size = migration_size
+        if island_rates is not None and len(island_rates) != islands:
+            raise ValueError(f"island_rates has {len(island_rates)} entries for {islands} islands.")
+        self.island_rates = island_rates
+        self.mutation_operator = mutation_operator
+        self.cache_size = cache_size
+        self._pool = None
+        # Elites and uncrossed copies come back every generation; cache.hits
+        # and cache.misses tell how many decodes were skipped
+        self.cache = FitnessCache(cache_size)
         
-        self.scheduler = SolutionBuilder(problem)
+        self.scheduler = SolutionBuilder(problem, machine_mode=machine_mode,
+                                         checkpoint_interval=max(1, math.isqrt(len(problem.jobs))))
 
     def solve(self) -> Solution:
-        # Initial Population: Random Permutations
-        base_jobs = self.problem.jobs[:]
-        population = []
-        for _ in range(self.pop_size):
-            perm = base_jobs[:]
-            random.shuffle(perm)
-            population.append(perm)
-            
-        best_sol = None
+        # No individual can beat the lower bound: stop as soon as one reaches it
+        self._start()
+        if self.islands > 1:
+            island = self._solve_islands()
+        else:
+            # The pool lives for the whole run. Each worker receives the problem
+            # once, at start-up; afterwards only permutations and makespans are
+            # sent. Random choices are all made here, so results match serial mode.
+            if self.workers > 1:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                                 initargs=(self.problem, dict(machine_mode=self.machine_mode),
+                                                           self._deadline))
+            try:
+                # Initial Population: Random Permutations
+                rng = np.random.default_rng(random.getrandbits(64))
+                island = _Island(self._random_population(self.pop_size, rng), rng,
+                                 self.mutation_rate, self.crossover_rate)
+                self._evolve(island, self.generations)
+            finally:
+                if self._pool is not None:
+                    self._pool.shutdown()
+                    self._pool = None
+            self.history = island.history
+            self.history_avg = island.history_avg
+
+        if island.best_sequence is None:
+            return None
+        # Only the best individual is turned into Job nodes
+        return self._finish(self.scheduler.build_from_indices(island.best_sequence.tolist()))
+
+    def _solve_islands(self) -> _Island:
+        """
+        Island model: each island evolves its own share of pop_size in a
+        separate process, for migration_interval generations at a time. Between
+        epochs the best migration_size individuals of island k replace the
+        last offspring of island k+1 (ring). Each island has its own RNG
+        seeded from the global one, so a seed gives the same run whatever the
+        process scheduling. Returns the island holding the best sequence.
+        """
+        size = max(2, self.pop_size // self.islands)
+        rates = self.island_rates or [(self.mutation_rate, self.crossover_rate)] * self.islands
+        islands = []
+        for mutation_rate, crossover_rate in rates:
+            rng = np.random.default_rng(random.getrandbits(64))
+            islands.append(_Island(self._random_population(size, rng), rng, mutation_rate, crossover_rate))
+
+        params = dict(pop_size=size, restart_threshold=self.restart_threshold, machine_mode=self.machine_mode,
+                      cache_size=self.cache_size, migration_size=self.migration_size,
+                      mutation_operator=self.mutation_operator, target_makespan=self.target_makespan,
+                      debug=self.debug)
+        processes = self.workers if self.workers > 1 else self.islands
         best_makespan = float('inf')
-        
-        generations_without_improvement = 0
-        self.history = []
-        
-        for gen in range(self.generations):
+        best = islands[0]  # generations=0: nothing evaluated, like the serial GA
+        with ProcessPoolExecutor(max_workers=processes, initializer=_init_island_worker,
+                                 initargs=(self.problem, params, self._deadline)) as pool:
+            done = 0
+            while done < self.generations:
+                epoch = min(self.migration_interval, self.generations - done)
+                islands = list(pool.map(_evolve_island, islands, [epoch] * len(islands)))
+                done += epoch
+                best = min(islands, key=lambda island: island.best_makespan)
+                if self.debug:
+                    print(f"Gen {done}, Best: {best.best_makespan} (islands: {[i.best_makespan for i in islands]})")
+                if best.best_makespan < best_makespan:
+                    best_makespan = best.best_makespan
+                    self._improved(lambda: self.scheduler.build_from_indices(best.best_sequence.tolist()))
+                if self._should_stop(best_makespan):
+                    print(f"Gen {done}: Stopping ({self.stop_reason}).")
+                    break
+                self._migrate(islands)
+
+        # Per generation: best over all islands so far, mean of the island averages
+        self.history = [min(values) for values in zip(*(island.history for island in islands))]
+        self.history_avg = [sum(values) / len(values) for values in zip(*(island.history_avg for island in islands))]
+        return best
+
+    def _migrate(self, islands: List[_Island]):
+        emigrants = [island.elites for island in islands]
+        for k, island in enumerate(islands):
+            incoming = emigrants[k - 1][:len(island.population) - 1]
+            if len(incoming):
+                island.population[-len(incoming):] = incoming
+
+    def _random_population(self, size: int, rng: np.random.Generator) -> np.ndarray:
+        base = np.broadcast_to(np.arange(len(self.problem.jobs), dtype=np.int32), (size, len(self.problem.jobs)))
+        return rng.permuted(base, axis=1)
+
+    def _evolve(self, island: _Island, generations: int, verbose: bool = True):
+        """Runs up to ``generations`` generations on the island, updating it in place."""
+        rng = island.rng
+        population = island.population
+        pop_size = len(population)
+
+        for _ in range(generations):
+            gen = island.generation
+            island.generation += 1
             # Evaluate
-            pop_fitness = []
-            for indiv in population:
-                sol = self.scheduler.build_from_sequence(indiv)
-                pop_fitness.append((sol.makespan, indiv, sol))
-                
-                if sol.makespan < best_makespan:
-                    best_makespan = sol.makespan
-                    best_sol = sol
-                    generations_without_improvement = 0 # Reset counter
-            
-            current_avg = sum(f[0] for f in pop_fitness) / len(pop_fitness)
-            self.history.append(best_makespan)
-            if not hasattr(self, 'history_avg'): self.history_avg = []
-            self.history_avg.append(current_avg)
+            fitness = np.asarray(self._evaluate(population), dtype=np.int64)
+            # Sort by fitness (makespan asc); stable, so ties keep their order
+            order = np.argsort(fitness, kind='stable')
+            population = population[order]
+            fitness = fitness[order]
+
+            if fitness[0] < island.best_makespan:
+                island.best_makespan = int(fitness[0])
+                island.best_sequence = population[0].copy()
+                island.stall = 0 # Reset counter
+                self._improved(lambda: self.scheduler.build_from_indices(island.best_sequence.tolist()))
+
+            island.history.append(island.best_makespan)
+            island.history_avg.append(float(fitness.mean()))
+            island.elites = population[:self.migration_size].copy()
+
+            if self._should_stop(island.best_makespan):
+                if verbose:
+                    print(f"Gen {gen}: Stopping ({self.stop_reason}).")
+                break
             
             # Restart Mechanism (Apocalypse)
-            generations_without_improvement += 1
-            if generations_without_improvement >= self.restart_threshold:
-                print(f"Gen {gen}: Stagnation detected. Restarting population...")
-                # Keep elite (top 10% or just 1?) 
-                # Let's keep best solution found so far + top 5 current
-                pop_fitness.sort(key=lambda x: x[0])
-                elite_count = max(1, int(self.pop_size * 0.1))
-                new_pop = [x[1] for x in pop_fitness[:elite_count]]
-                
-                # Fill rest with random
-                while len(new_pop) < self.pop_size:
-                    perm = base_jobs[:]
-                    random.shuffle(perm)
-                    new_pop.append(perm)
-                
-                population = new_pop
-                generations_without_improvement = 0
+            island.stall += 1
+            if island.stall >= self.restart_threshold:
+                if verbose:
+                    print(f"Gen {gen}: Stagnation detected. Restarting population...")
+                # Keep the top 10%, fill the rest with random permutations
+                elite_count = max(1, int(pop_size * 0.1))
+                population = np.vstack([population[:elite_count],
+                                        self._random_population(pop_size - elite_count, rng)])
+                island.stall = 0
                 continue
             
-            # Normal Evolution
-            # Sort by fitness (makespan asc)
-            pop_fitness.sort(key=lambda x: x[0])
-            
-            # Elitism
-            new_pop = [x[1] for x in pop_fitness[:2]]
-            
-            # Selection & Crossover
-            while len(new_pop) < self.pop_size:
-                p1 = self._tournament(pop_fitness)
-                p2 = self._tournament(pop_fitness)
-                
-                if random.random() < self.crossover_rate:
-                    c1 = self._ox_crossover(p1, p2)
-                    c2 = self._ox_crossover(p2, p1)
-                else:
-                    c1, c2 = p1[:], p2[:]
-                
-                new_pop.append(self._mutate(c1))
-                if len(new_pop) < self.pop_size:
-                    new_pop.append(self._mutate(c2))
-            
-            population = new_pop
-            if (gen+1) % 10 == 0:
-                print(f"Gen {gen+1}, Best: {best_makespan}")
-                
-        return best_sol
-
-    def _tournament(self, pop_fitness, k=3):
-        # Defensive: ensure population not empty and clamp k
-        if not pop_fitness:
-            raise RuntimeError("Population fitness list is empty in tournament selection")
-        k = max(1, min(k, len(pop_fitness)))
-        candidates = random.sample(pop_fitness, k)
-        candidates.sort(key=lambda x: x[0])
-        # Return a copy of the sequence to avoid accidental aliasing
-        return candidates[0][1][:]
-
-    def _ox_crossover(self, p1: List[Job], p2: List[Job]) -> List[Job]:
-        # Optimized Order Crossover (OX) with Set lookup
-        size = len(p1)
-        # If too small, return a copy
-        if size < 2:
-            return p1[:]
-        start, end = sorted(random.sample(range(size), 2))
-
-        child = [None] * size
-        # Copy subsegment from p1
-        child[start:end+1] = p1[start:end+1]
-
-        # Create set for fast lookup of jobs already in child (use ids)
-        jobs_in_child = {job.id for job in child if job is not None}
-
-        current_p2_idx = 0
-        for i in range(size):
-            if child[i] is None:
-                # Find next job in p2 that is not in child
-                while current_p2_idx < size and p2[current_p2_idx].id in jobs_in_child:
-                    current_p2_idx += 1
-
-                if current_p2_idx < size:
-                    child[i] = p2[current_p2_idx]
-                    jobs_in_child.add(p2[current_p2_idx].id)
+            # Normal Evolution: elitism, then tournament + OX + mutation for the rest
+            elite_count = min(2, pop_size)
+            children = self._offspring(population, pop_size - elite_count, island, rng)
+            population = np.vstack([population[:elite_count], children])
+            if verbose and (gen+1) % 10 == 0:
+                print(f"Gen {gen+1}, Best: {island.best_makespan}")
+
+        island.population = population
+
+    def _evaluate(self, population: np.ndarray) -> List[int]:
+        # Cached and repeated individuals are looked up; the rest is decoded
+        # in one vectorized call. Only makespans come back, no Job/Solution
+        # objects per individual.
+        keys = [FitnessCache.key(indiv) for indiv in population]
+        makespans = [self.cache.get(key) for key in keys]
+        pending = {}
+        for i, key in enumerate(keys):
+            if makespans[i] is None and key not in pending:
+                pending[key] = i
+        if pending:
+            for key, makespan in zip(pending, self._decode(population[list(pending.values())])):
+                self.cache.put(key, makespan)
+                pending[key] = makespan
+            makespans = [pending[key] if makespan is None else makespan for key, makespan in zip(keys, makespans)]
+        return makespans
 
+    def _decode(self, population: np.ndarray) -> List[int]:
+        if self._pool is None:
+            return self.scheduler.evaluate_batch(population).tolist()
+        # One contiguous slice per worker; map keeps the order
+        chunks = np.array_split(population, self.workers)
+        results = self._pool.map(_evaluate_chunk, [chunk for chunk in chunks if len(chunk)])
+        return [makespan for chunk in results for makespan in chunk]
+
+    def _offspring(self, population: np.ndarray, count: int, island: _Island, rng: np.random.Generator) -> np.ndarray:
+        """``count`` children of the (fitness-sorted) population, in pairs as (c1, c2, c1, c2, ...)."""
+        n = population.shape[1]
+        pairs = (count + 1) // 2
+        p1 = population[self._tournament(len(population), pairs, rng)]
+        p2 = population[self._tournament(len(population), pairs, rng)]
+
+        c1, c2 = p1.copy(), p2.copy()
+        if n >= 2:
+            crossed = rng.random(pairs) < island.crossover_rate
+            if crossed.any():
+                start, end = self._cut_points(n, int(crossed.sum()), rng)
+                c1[crossed] = self._ox_crossover(p1[crossed], p2[crossed], start, end)
+                c2[crossed] = self._ox_crossover(p2[crossed], p1[crossed], start, end)
+
+        children = np.empty((2 * pairs, n), dtype=population.dtype)
+        children[0::2] = c1
+        children[1::2] = c2
+        children = children[:count]
+        if n >= 2:
+            self._mutate(children, island.mutation_rate, rng)
+        return children
+
+    def _tournament(self, pop_size: int, count: int, rng: np.random.Generator, k: int = 3) -> np.ndarray:
+        # The population is sorted by fitness, so the best of k random rows is
+        # simply the smallest row index drawn
+        k = max(1, min(k, pop_size))
+        return rng.integers(0, pop_size, size=(count, k)).min(axis=1)
+
+    @staticmethod
+    def _cut_points(n: int, count: int, rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray]:
+        """Two distinct positions per row, as (start, end) with start < end."""
+        a = rng.integers(0, n, size=count)
+        b = rng.integers(0, n - 1, size=count)
+        b += b >= a
+        return np.minimum(a, b), np.maximum(a, b)
+
+    @staticmethod
+    def _ox_crossover(p1: np.ndarray, p2: np.ndarray, start: np.ndarray, end: np.ndarray) -> np.ndarray:
+        """
+        Order Crossover (OX) for every row at once: the child keeps p1[start:end+1]
+        in place and gets the remaining jobs in p2's order, left to right.
+        """
+        positions = np.arange(p1.shape[1])
+        segment = (positions >= start[:, None]) & (positions <= end[:, None])
+        # in_segment[r, job]: job is inside row r's copied segment
+        in_segment = np.zeros(p1.shape, dtype=bool)
+        np.put_along_axis(in_segment, p1, segment, axis=1)
+        from_p2 = ~np.take_along_axis(in_segment, p2, axis=1)
+
+        child = np.empty_like(p1)
+        child[segment] = p1[segment]
+        # Every row has as many free positions as jobs left in p2, and boolean
+        # indexing walks both row by row, left to right
+        child[~segment] = p2[from_p2]
         return child
 
-    def _mutate(self, sequence: List[Job]) -> List[Job]:
-        # Guard against tiny sequences
-        if len(sequence) < 2:
-            return sequence
-        if random.random() < self.mutation_rate:
-            idx1, idx2 = random.sample(range(len(sequence)), 2)
-            sequence[idx1], sequence[idx2] = sequence[idx2], sequence[idx1]
-        return sequence
+    def _mutate(self, children: np.ndarray, rate: float, rng: np.random.Generator):
+        """Swaps two jobs or moves one job to another position, in place, with probability ``rate`` per row."""
+        rows = np.flatnonzero(rng.random(len(children)) < rate)
+        if rows.size == 0:
+            return
+        n = children.shape[1]
+        i, j = self._cut_points(n, rows.size, rng)
+        if self.mutation_operator == 'swap':
+            insert = np.zeros(rows.size, dtype=bool)
+        elif self.mutation_operator == 'insert':
+            insert = np.ones(rows.size, dtype=bool)
+        else:
+            insert = rng.random(rows.size) < 0.5
+
+        swap_rows = rows[~insert]
+        a, b = i[~insert], j[~insert]
+        children[swap_rows, a], children[swap_rows, b] = children[swap_rows, b], children[swap_rows, a]
+
+        if insert.any():
+            # Move the job at ``src`` to ``dst``, shifting the jobs in between by one
+            ins_rows = rows[insert]
+            forward = rng.random(ins_rows.size) < 0.5
+            src = np.where(forward, i[insert], j[insert])[:, None]
+            dst = np.where(forward, j[insert], i[insert])[:, None]
+            p = np.arange(n)[None, :]
+            take = p + ((p >= src) & (p < dst)) - ((p > dst) & (p <= src))
+            take = np.where(p == dst, src, take)
+            children[ins_rows] = np.take_along_axis(children[ins_rows], take, axis=1)
@@ -0,0 +1,146 @@
+from typing import Tuple
+import numpy as np
+from scipy.optimize import Bounds, LinearConstraint, milp
+from scipy.sparse import coo_array, csr_array
+from src.core.model import ProblemInstance, Solution
+from src.core.scheduler import SolutionBuilder
+from src.solvers.base import Solver
+from src.solvers.greedy import GreedySolver
+
+
+class MILPSolver(Solver):
+    """
+    Time-indexed MILP solved with SciPy's HiGHS backend (scipy.optimize.milp).
+
+    x_jt = 1 if job j starts at period t, for t in [0, H - p_j], where the
+    horizon H is the greedy makespan (a feasible schedule always fits).
+
+        min C
+        sum_t x_jt = 1                                            for all j
+        sum_j sum_{t = tau - p_j + 1}^{tau} x_jt <= m             for all tau
+        sum_j q_jk sum_{t = tau - p_j + 1}^{tau} x_jt <= Q_k      for all k, tau
+        C >= sum_t (t + p_j) x_jt                                 for all j
+        lower bound <= C <= H
+
+    The machines only count (identical machines); ids are handed out from the
+    start times afterwards, as in SolutionBuilder's 'cumulative' mode.
+
+    scipy's milp takes no MIP start, so the greedy schedule is used through
+    the horizon and the bound on C, and is returned whenever HiGHS stops
+    without a better schedule. Run controls: time_limit is passed to HiGHS;
+    the model is built once and solved in one call, so cancel_token,
+    target_makespan and on_improvement only act before and after it.
+    """
+    def __init__(self, problem: ProblemInstance,
+                 mip_rel_gap: float = 0.0, # Relative gap at which HiGHS may stop
+                 **controls): # Run controls: time_limit, target_makespan, ... (see Solver)
+        super().__init__(problem, **controls)
+        self.mip_rel_gap = mip_rel_gap
+        self.scheduler = SolutionBuilder(problem, machine_mode='cumulative')
+
+    def solve(self) -> Solution:
+        self._start()
+        incumbent = GreedySolver(self.problem).solve()
+        self._improved(lambda: incumbent)
+        self.optimal = False
+        self.status = None
+        self.dual_bound = self.lower_bound
+        self.build_time = 0.0
+        if not self.problem.jobs or self._should_stop(incumbent.makespan):
+            self.optimal = self.stop_reason == 'lower_bound'
+            return self._finish(incumbent)
+
+        horizon = incumbent.makespan
+        build_start = self.elapsed
+        c, constraints, bounds, integrality, job_of, start_of = self.build_model(horizon)
+        self.build_time = self.elapsed - build_start
+        options = {'disp': False, 'mip_rel_gap': self.mip_rel_gap}
+        if self.time_limit is not None:
+            options['time_limit'] = max(0.0, self.time_limit - self.elapsed)
+        result = milp(c, constraints=constraints, bounds=bounds, integrality=integrality, options=options)
+        self.status = result.message
+        print(f"MILP: {len(c) - 1} variables, {sum(con.A.shape[0] for con in constraints)} rows, "
+              f"built in {self.build_time:.2f}s; HiGHS: {result.message}")
+        if getattr(result, 'mip_dual_bound', None) is not None:
+            self.dual_bound = max(self.lower_bound, int(np.ceil(result.mip_dual_bound - 1e-6)))
+
+        if result.x is None:
+            self.stop_reason = 'time_limit' if result.status == 1 else self.stop_reason
+            return self._finish(incumbent)
+        if result.status == 1:
+            self.stop_reason = 'time_limit'
+        self.optimal = result.status == 0 and self.mip_rel_gap == 0
+
+        chosen = result.x[:-1] > 0.5
+        starts = np.zeros(len(self.problem.jobs), dtype=np.int64)
+        starts[job_of[chosen]] = start_of[chosen]
+        solution = self.scheduler.solution_from_starts(starts)
+        if solution.makespan >= incumbent.makespan:
+            return self._finish(incumbent)
+        self._improved(lambda: solution)
+        self._should_stop(solution.makespan)
+        return self._finish(solution)
+
+    def build_model(self, horizon: int) -> Tuple:
+        """
+        Vectorized sparse model for start periods [0, horizon - p_j]. Returns
+        (c, constraints, bounds, integrality, job_of, start_of), where the
+        last two give the job and start period of every x variable (C is the
+        last variable).
+        """
+        compiled = self.problem.compiled
+        n = compiled.num_jobs
+        durations = compiled.durations.astype(np.int64)
+        slots = np.maximum(horizon - durations + 1, 0)
+        num_x = int(slots.sum())
+
+        # One x variable per (job, start period), grouped by job
+        job_of = np.repeat(np.arange(n), slots)
+        first = np.cumsum(slots) - slots
+        start_of = np.arange(num_x) - np.repeat(first, slots)
+
+        # Assignment: sum_t x_jt = 1
+        assign = csr_array((np.ones(num_x), (job_of, np.arange(num_x))), shape=(n, num_x + 1))
+
+        # Every x_jt covers periods t .. t + p_j - 1
+        span = durations[job_of]
+        cover_var = np.repeat(np.arange(num_x), span)
+        cover_first = np.cumsum(span) - span
+        cover_period = start_of[cover_var] + np.arange(len(cover_var)) - np.repeat(cover_first, span)
+
+        # Capacity rows: the machine pool (demand 1 for every job), then each resource
+        demand = np.hstack([np.ones((n, 1), dtype=np.int64), compiled.demand.astype(np.int64)])
+        capacities = np.concatenate([[self.problem.num_machines], compiled.capacities]).astype(np.int64)
+        job_pairs, resources = np.nonzero(demand)
+        # Repeat the covering entries of job j for each resource j uses
+        per_job_entries = np.bincount(job_of[cover_var], minlength=n)
+        order = np.argsort(job_of[cover_var], kind='stable')
+        entry_first = np.cumsum(per_job_entries) - per_job_entries
+        counts = per_job_entries[job_pairs]
+        pair_of_entry = np.repeat(np.arange(len(job_pairs)), counts)
+        offset = np.arange(len(pair_of_entry)) - np.repeat(np.cumsum(counts) - counts, counts)
+        entries = order[entry_first[job_pairs[pair_of_entry]] + offset]
+        rows = resources[pair_of_entry] * horizon + cover_period[entries]
+        values = demand[job_pairs[pair_of_entry], resources[pair_of_entry]]
+        capacity = coo_array((values, (rows, cover_var[entries])),
+                             shape=(len(capacities) * horizon, num_x + 1)).tocsr()
+
+        # Makespan: C - sum_t (t + p_j) x_jt >= 0
+        finish = csr_array((np.concatenate([-(start_of + durations[job_of]), np.ones(n)]),
+                            (np.concatenate([job_of, np.arange(n)]),
+                             np.concatenate([np.arange(num_x), np.full(n, num_x)]))),
+                           shape=(n, num_x + 1))
+
+        constraints = [
+            LinearConstraint(assign, 1, 1),
+            LinearConstraint(capacity, -np.inf, np.repeat(capacities, horizon)),
+            LinearConstraint(finish, 0, np.inf),
+        ]
+        c = np.zeros(num_x + 1)
+        c[-1] = 1
+        lower = np.zeros(num_x + 1)
+        upper = np.ones(num_x + 1)
+        lower[-1] = self.lower_bound
+        upper[-1] = horizon
+        integrality = np.ones(num_x + 1)
+        return c, constraints, Bounds(lower, upper), integrality, job_of, start_of
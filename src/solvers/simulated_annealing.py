@@ -1,50 +1,201 @@
 import random
 import math
-from typing import List
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Tuple
 from src.core.model import ProblemInstance, Solution, Job
 from src.core.scheduler import SolutionBuilder
+from src.core.fitness_cache import FitnessCache
+from src.solvers.base import Solver
 
-class SimulatedAnnealingSolver:
-    def __init__(self, problem: ProblemInstance, 
-                 initial_temp: float = 1000.0, 
-                 cooling_rate: float = 0.995, 
-                 max_iter: int = 5000):
-        self.problem = problem
+# Per-process solver of the replica pool, created once by _init_replica_worker
+_replica_solver = None
+
+def _init_replica_worker(problem: ProblemInstance, params: dict, deadline: Optional[float]):
+    global _replica_solver
+    _replica_solver = SimulatedAnnealingSolver.for_worker(problem, params, deadline)
+
+def _run_replica(chain: '_Chain', iterations: int) -> '_Chain':
+    # Several replicas may share this process: resync the builder first
+    _replica_solver.scheduler.evaluate_makespan(chain.sequence)
+    _replica_solver._anneal(chain, iterations, cooling_rate=1.0)
+    return chain
+
+@dataclass
+class _Chain:
+    """State of one annealing chain (the only one in single-chain mode)."""
+    sequence: List[int]
+    makespan: int
+    temp: float
+    rng: Any  # random.Random, or the random module itself in single-chain mode
+    best_sequence: Optional[List[int]] = None
+    best_makespan: float = float('inf')
+    history: List[int] = field(default_factory=list)
+
+    def __post_init__(self):
+        if self.best_sequence is None:
+            self.best_sequence = self.sequence
+            self.best_makespan = self.makespan
+
+class SimulatedAnnealingSolver(Solver):
+    """
+    Swap-neighborhood simulated annealing over job orders.
+
+    With replicas=R > 1 it runs parallel tempering instead: R chains at fixed
+    temperatures, geometrically spaced over ``temp_range``, each in a process
+    pool for swap_interval iterations at a time. Between rounds neighbouring
+    replicas try a Metropolis swap of their sequences, so good sequences
+    drift to the cold chains while the hot ones keep exploring. Nothing cools
+    down, so no chain freezes before max_iter. By default the range is scaled
+    to the instance's mean job duration (the typical size of a makespan
+    change), not to the absolute initial_temp.
+    """
+    def __init__(self, problem: ProblemInstance,
+                 initial_temp: float = 1000.0,
+                 cooling_rate: float = 0.995,
+                 max_iter: int = 5000,
+                 machine_mode: str = 'dedicated',
+                 cache_size: int = 10000, # Makespans of recently seen sequences (0 disables)
+                 replicas: int = 1, # >1: parallel tempering with one chain per replica
+                 swap_interval: int = 100, # Iterations between replica swap attempts
+                 temp_range: Optional[Tuple[float, float]] = None, # (coldest, hottest) replica temperature
+                 **controls): # Run controls: time_limit, target_makespan, ... (see Solver)
+        super().__init__(problem, **controls)
         self.initial_temp = initial_temp
         self.cooling_rate = cooling_rate
         self.max_iter = max_iter
-        self.scheduler = SolutionBuilder(problem)
+        self.machine_mode = machine_mode
+        self.cache_size = cache_size
+        self.replicas = replicas
+        self.swap_interval = swap_interval
+        self.temp_range = temp_range
+        # Swapping back and forth revisits sequences; cache.hits counts skipped decodes
+        self.cache = FitnessCache(cache_size)
+        # Checkpoints let a swap at (i, j) re-decode only from min(i, j) onwards
+        self.scheduler = SolutionBuilder(problem, machine_mode=machine_mode,
+                                         checkpoint_interval=max(1, math.isqrt(len(problem.jobs))))
 
     def solve(self) -> Solution:
-        # 1. Initial Solution (Random)
-        current_sequence = self.problem.jobs[:]
-        random.shuffle(current_sequence)
-        
-        current_sol = self.scheduler.build_from_sequence(current_sequence)
-        current_makespan = current_sol.makespan
-        
-        best_sol = current_sol
-        best_makespan = current_makespan
-        
-        temp = self.initial_temp
-        self.history = []
-        
-        for i in range(self.max_iter):
+        self._start()
+        if self.replicas > 1:
+            best_sequence = self._solve_tempering()
+        else:
+            # 1. Initial Solution (Random)
+            # Sequences are indices into problem.jobs; moves are scored with the
+            # makespan-only path and only the best sequence becomes a Solution.
+            current_sequence = list(range(len(self.problem.jobs)))
+            random.shuffle(current_sequence)
+
+            current_makespan = self.scheduler.evaluate_makespan(current_sequence)
+            self.cache.put(FitnessCache.key(current_sequence), current_makespan)
+
+            chain = _Chain(current_sequence, current_makespan, self.initial_temp, random)
+            self._anneal(chain, self.max_iter, self.cooling_rate)
+            self.history = chain.history
+            best_sequence = chain.best_sequence
+
+        return self._finish(self.scheduler.build_from_indices(best_sequence))
+
+    def temperatures(self) -> List[float]:
+        """Replica temperatures, coldest first."""
+        if self.temp_range is not None:
+            low, high = self.temp_range
+        else:
+            durations = [job.duration for job in self.problem.jobs]
+            high = max(1.0, sum(durations) / max(1, len(durations)))
+            low = high / 50
+        if self.replicas == 1:
+            return [low]
+        ratio = (high / low) ** (1 / (self.replicas - 1))
+        return [low * ratio ** k for k in range(self.replicas)]
+
+    def _solve_tempering(self) -> List[int]:
+        temps = self.temperatures()
+        chains = []
+        for temp in temps:
+            rng = random.Random(random.getrandbits(64))
+            sequence = list(range(len(self.problem.jobs)))
+            rng.shuffle(sequence)
+            chains.append(_Chain(sequence, self.scheduler.evaluate_makespan(sequence), temp, rng))
+
+        self.swap_attempts = 0
+        self.swap_accepts = 0
+        params = dict(machine_mode=self.machine_mode, cache_size=self.cache_size,
+                      target_makespan=self.target_makespan, debug=self.debug)
+        best_makespan = min(chain.makespan for chain in chains)
+        with ProcessPoolExecutor(max_workers=self.replicas, initializer=_init_replica_worker,
+                                 initargs=(self.problem, params, self._deadline)) as pool:
+            done = 0
+            round_id = 0
+            while done < self.max_iter:
+                iterations = min(self.swap_interval, self.max_iter - done)
+                chains = list(pool.map(_run_replica, chains, [iterations] * len(chains)))
+                done += iterations
+                self.replica_best = [chain.best_makespan for chain in chains]
+                # Progress about every 1000 iterations, however short the rounds are
+                if done // 1000 > (done - iterations) // 1000 or done == self.max_iter:
+                    print(f"Iter {done}: replica best {self.replica_best}")
+                best = min(chains, key=lambda chain: chain.best_makespan)
+                if best.best_makespan < best_makespan:
+                    best_makespan = best.best_makespan
+                    self._improved(lambda: self.scheduler.build_from_indices(best.best_sequence))
+                if self._should_stop(best_makespan):
+                    break
+                self._swap_replicas(chains, round_id % 2)
+                round_id += 1
+
+        # Per iteration: best over all replicas so far
+        self.history = [min(values) for values in zip(*(chain.history for chain in chains))]
+        return min(chains, key=lambda chain: chain.best_makespan).best_sequence
+
+    def _swap_replicas(self, chains: List[_Chain], parity: int):
+        """Metropolis swaps between neighbouring temperatures, alternating even and odd pairs."""
+        for k in range(parity, len(chains) - 1, 2):
+            cold, hot = chains[k], chains[k + 1]
+            self.swap_attempts += 1
+            # Accept with min(1, exp((1/T_cold - 1/T_hot) * (E_cold - E_hot)))
+            exponent = (1 / cold.temp - 1 / hot.temp) * (cold.makespan - hot.makespan)
+            if exponent >= 0 or random.random() < math.exp(exponent):
+                self.swap_accepts += 1
+                cold.sequence, hot.sequence = hot.sequence, cold.sequence
+                cold.makespan, hot.makespan = hot.makespan, cold.makespan
+                for chain in (cold, hot):
+                    if chain.makespan < chain.best_makespan:
+                        chain.best_makespan = chain.makespan
+                        chain.best_sequence = chain.sequence
+
+    def _anneal(self, chain: _Chain, iterations: int, cooling_rate: float):
+        """Runs ``iterations`` moves of the chain. The builder must hold chain.sequence."""
+        rng = chain.rng
+        current_sequence = chain.sequence
+        current_makespan = chain.makespan
+        temp = chain.temp
+
+        for i in range(iterations):
+            if self._should_stop(chain.best_makespan):
+                break
             # 2. Generate Neighbor (Swap)
             neighbor_sequence = current_sequence[:]
             if len(neighbor_sequence) < 2:
                 # Nothing to swap for sequences of length < 2
                 neighbor_sequence = current_sequence[:]
+                first_changed = len(neighbor_sequence)
             else:
-                idx1, idx2 = random.sample(range(len(neighbor_sequence)), 2)
+                idx1, idx2 = rng.sample(range(len(neighbor_sequence)), 2)
                 neighbor_sequence[idx1], neighbor_sequence[idx2] = neighbor_sequence[idx2], neighbor_sequence[idx1]
+                first_changed = min(idx1, idx2)
+
+            key = FitnessCache.key(neighbor_sequence)
+            neighbor_makespan = self.cache.get(key)
+            decoded = neighbor_makespan is None
+            if decoded:
+                # The prefix before the first swapped position decodes identically
+                neighbor_makespan = self.scheduler.evaluate_makespan(neighbor_sequence, position=first_changed)
+                self.cache.put(key, neighbor_makespan)
 
-            neighbor_sol = self.scheduler.build_from_sequence(neighbor_sequence)
-            neighbor_makespan = neighbor_sol.makespan
-            
             # 3. Acceptance Probability
             delta = neighbor_makespan - current_makespan
-            
+
             accept = False
             if delta < 0:
                 accept = True
@@ -52,24 +203,36 @@ class SimulatedAnnealingSolver:
                 # Avoid overflow with very low temp
                 if temp > 1e-10:
                     prob = math.exp(-delta / temp)
-                    if random.random() < prob:
+                    if rng.random() < prob:
                         accept = True
-            
+
             if accept:
+                if not decoded:
+                    # The builder must hold current_sequence for the next resume
+                    self.scheduler.evaluate_makespan(neighbor_sequence, position=first_changed)
                 current_sequence = neighbor_sequence
                 current_makespan = neighbor_makespan
-                current_sol = neighbor_sol
-                
+
                 # Update Best
-                if current_makespan < best_makespan:
-                    best_makespan = current_makespan
-                    best_sol = current_sol
-            
+                if current_makespan < chain.best_makespan:
+                    chain.best_makespan = current_makespan
+                    chain.best_sequence = current_sequence
+                    self._improved(self.scheduler.to_solution)
+                    if self._should_stop(chain.best_makespan):
+                        # Optimal (or good enough), or out of budget
+                        chain.history.append(chain.best_makespan)
+                        break
+            elif decoded:
+                # Keep the builder's checkpoints in sync with current_sequence
+                self.scheduler.revert()
+
             # 4. Cool Down
-            temp *= self.cooling_rate
-            self.history.append(best_makespan)
-            
+            temp *= cooling_rate
+            chain.history.append(chain.best_makespan)
+
             # Optional: Restart if stuck? SA usually doesn't restart explicitly but relies on reheating.
             # We keep it simple for now.
-            
-        return best_sol
+
+        chain.sequence = current_sequence
+        chain.makespan = current_makespan
+        chain.temp = temp
@@ -0,0 +1,115 @@
+from typing import Dict, List, Optional, Tuple
+from src.core.model import ProblemInstance, Solution
+from src.solvers.branch_and_bound import BranchAndBoundSolver, ParentState
+from src.solvers.greedy import GreedySolver
+
+
+class SubsetDPSolver(BranchAndBoundSolver):
+    """
+    Exact dynamic programming over the set of scheduled jobs.
+
+    Uses the partial schedules of BranchAndBoundSolver, but a state is
+    canonicalised to what its completions depend on: the set of scheduled
+    jobs and the frontier, i.e. the last start and the resource usage after
+    it (machine free times and the releases of the jobs still running). Any
+    order of the scheduled jobs that reaches the same frontier is the same
+    state, so the search visits O(2^n) frontier states instead of n! orders.
+
+    The memo stores, per state, the best completion makespan (None if no
+    completion beats the incumbent), and the bounds of BranchAndBoundSolver
+    prune states that cannot improve. Once the memo holds max_states states
+    the DP gives up and the whole instance is handed to BranchAndBoundSolver
+    with the time left and the DP's best schedule as its incumbent
+    (``fallback`` is then True).
+    """
+    def __init__(self, problem: ProblemInstance,
+                 max_states: int = 2_000_000, # Memo cap before falling back to branch and bound
+                 **controls): # Run controls: time_limit, target_makespan, ... (see Solver)
+        super().__init__(problem, memo_limit=0, **controls)
+        self.max_states = max_states
+
+    def solve(self) -> Solution:
+        self._start()
+        n = self.problem.compiled.num_jobs
+
+        incumbent = GreedySolver(self.problem).solve()
+        self.best_makespan = incumbent.makespan
+        self.best_order: Optional[List[int]] = None
+        self._improved(lambda: incumbent)
+        self.nodes = 0
+        self.pruned = 0
+        self.hits = 0
+        self.fallback = False
+        self.optimal = False
+
+        if n and not self._should_stop(self.best_makespan):
+            self._prepare()
+            self._order: List[int] = []
+            self._values: Dict[Tuple, Optional[int]] = {}
+            self._stopped = False
+            self._value((1 << n) - 1, 0, 0, self._root())
+            self.states = len(self._values)
+            if self.stop_reason is None and self._stopped:
+                return self._solve_fallback(incumbent)
+
+        self.optimal = self.stop_reason in (None, 'lower_bound')
+        print(f"Subset DP: {self.nodes} nodes, {self.hits} memo hits, {self.pruned} pruned, "
+              f"best {self.best_makespan} ({'optimal' if self.optimal else self.stop_reason})")
+        if self.best_order is None:
+            return self._finish(incumbent)
+        return self._finish(self.scheduler.build_from_indices(self.best_order))
+
+    def _value(self, unscheduled: int, last_start: int, makespan: int, parent: ParentState) -> Optional[int]:
+        """Best completion makespan of the current partial schedule, or None if it cannot beat the incumbent."""
+        self.nodes += 1
+        if self.nodes % 1024 == 0 and self._should_stop(self.best_makespan):
+            self._stopped = True
+        if self._stopped:
+            return None
+
+        if not unscheduled:
+            return makespan if self._complete(makespan) else None
+
+        key = (unscheduled, self._profile.signature_from(last_start))
+        if key in self._values:
+            self.hits += 1
+            value = self._values[key]
+            return value if value is not None and value < self.best_makespan else None
+
+        # No tie-break on the last job index: states reached in either order merge in the memo
+        best = None
+        found = self._children(unscheduled, last_start, -1, makespan, parent)
+        children, remaining, earliest = found or ((), None, None)
+        for start, finish, idx in children:
+            if finish >= self.best_makespan:
+                continue
+            self._push(idx, start, finish)
+            value = self._value(unscheduled & ~(1 << idx), start, max(makespan, finish), (remaining, earliest, finish))
+            self._pop(idx, start, finish)
+            if self._stopped:
+                return None
+            if value is not None and (best is None or value < best):
+                best = value
+
+        if len(self._values) >= self.max_states:
+            self._stopped = True  # stop_reason stays None: solve() falls back
+            return None
+        self._values[key] = best
+        return best
+
+    def _solve_fallback(self, incumbent: Solution) -> Solution:
+        print(f"Subset DP: memo full ({self.max_states} states), falling back to branch and bound")
+        self.fallback = True
+        time_left = None if self.time_limit is None else max(0.0, self.time_limit - self.elapsed)
+        if self.best_order is not None:
+            incumbent = self.scheduler.build_from_indices(self.best_order)
+        solver = BranchAndBoundSolver(self.problem, incumbent=incumbent, time_limit=time_left,
+                                      target_makespan=self.target_makespan, cancel_token=self.cancel_token,
+                                      on_improvement=self.on_improvement, debug=self.debug)
+        solution = solver.solve()
+        self.stop_reason = solver.stop_reason
+        self.optimal = solver.optimal
+        self.best_makespan = solution.makespan
+        self.nodes += solver.nodes
+        self.pruned += solver.pruned
+        return self._finish(solution)
@@ -0,0 +1,128 @@
+import random
+import math
+from typing import List, Tuple
+from src.core.model import ProblemInstance, Solution
+from src.core.scheduler import SolutionBuilder
+from src.solvers.base import Solver
+
+# A move is (kind, i, j): 'swap' exchanges positions i and j, 'insert' moves
+# the job at position i to position j.
+Move = Tuple[str, int, int]
+
+
+class TabuSearchSolver(Solver):
+    """
+    Tabu search over job orders with swap and insert moves.
+
+    Every iteration samples a candidate list of ``candidates`` moves instead
+    of scanning the whole O(n^2) neighbourhood, scores them with the builder's
+    checkpointed makespan path and applies the best admissible one, even if
+    it is worse than the current sequence.
+
+    The tabu list is attribute based: the jobs a move repositions may not be
+    moved again for ``tabu_tenure`` iterations (with a sampled candidate list,
+    forbidding exact (job, position) pairs would almost never trigger). A
+    tabu move is still allowed when it beats the best makespan found so far
+    (aspiration).
+    """
+    def __init__(self, problem: ProblemInstance,
+                 max_iter: int = 1000,
+                 tabu_tenure: int = 15, # Iterations a moved job stays tabu
+                 candidates: int = 20, # Moves sampled and evaluated per iteration
+                 neighborhood: str = 'both', # 'swap', 'insert' or 'both' (half of the candidates each)
+                 machine_mode: str = 'dedicated',
+                 **controls): # Run controls: time_limit, target_makespan, ... (see Solver)
+        super().__init__(problem, **controls)
+        if neighborhood not in ('swap', 'insert', 'both'):
+            raise ValueError(f"Unknown neighborhood '{neighborhood}', use 'swap', 'insert' or 'both'.")
+        self.max_iter = max_iter
+        self.tabu_tenure = tabu_tenure
+        self.candidates = candidates
+        self.neighborhood = neighborhood
+        self.machine_mode = machine_mode
+        # Checkpoints let a move at (i, j) re-decode only from min(i, j) onwards
+        self.scheduler = SolutionBuilder(problem, machine_mode=machine_mode,
+                                         checkpoint_interval=max(1, math.isqrt(len(problem.jobs))))
+
+    def solve(self) -> Solution:
+        self._start()
+        n = len(self.problem.jobs)
+        # Start from the longest-processing-time order, a good greedy sequence
+        durations = self.problem.compiled.duration_list
+        current_sequence = sorted(range(n), key=lambda idx: -durations[idx])
+        current_makespan = self.scheduler.evaluate_makespan(current_sequence)
+        best_sequence = current_sequence
+        best_makespan = current_makespan
+        self._improved(self.scheduler.to_solution)
+
+        # job index -> first iteration at which the job may be moved again
+        tabu = [0] * n
+        self.history = []
+        self.tabu_hits = 0
+        self.aspirations = 0
+
+        if n >= 2:
+            for iteration in range(self.max_iter):
+                if self._should_stop(best_makespan):
+                    break
+                chosen = None
+                chosen_makespan = None
+                for move in self._sample_moves(n):
+                    neighbor = self._apply(current_sequence, move)
+                    makespan = self.scheduler.evaluate_makespan(neighbor, position=min(move[1], move[2]))
+                    # Only the applied move is kept in the builder
+                    self.scheduler.revert()
+                    if chosen_makespan is not None and makespan >= chosen_makespan:
+                        continue
+                    if any(tabu[job] > iteration for job in self._moved_jobs(current_sequence, move)):
+                        if makespan >= best_makespan:
+                            self.tabu_hits += 1
+                            continue
+                        self.aspirations += 1
+                    chosen, chosen_makespan = (move, neighbor), makespan
+
+                if chosen is not None:
+                    move, neighbor = chosen
+                    for job in self._moved_jobs(current_sequence, move):
+                        tabu[job] = iteration + 1 + self.tabu_tenure
+                    current_sequence = neighbor
+                    current_makespan = self.scheduler.evaluate_makespan(neighbor, position=min(move[1], move[2]))
+                    if current_makespan < best_makespan:
+                        best_makespan = current_makespan
+                        best_sequence = current_sequence
+                        self._improved(self.scheduler.to_solution)
+
+                self.history.append(best_makespan)
+                if iteration % 100 == 0:
+                    print(f"Iter {iteration}: Current {current_makespan}, Best {best_makespan}")
+
+        return self._finish(self.scheduler.build_from_indices(best_sequence))
+
+    def _sample_moves(self, n: int) -> List[Move]:
+        moves = []
+        for k in range(self.candidates):
+            if self.neighborhood == 'both':
+                kind = 'swap' if k % 2 == 0 else 'insert'
+            else:
+                kind = self.neighborhood
+            i, j = random.sample(range(n), 2)
+            moves.append((kind, i, j))
+        return moves
+
+    @staticmethod
+    def _apply(sequence: List[int], move: Move) -> List[int]:
+        kind, i, j = move
+        neighbor = sequence[:]
+        if kind == 'swap':
+            neighbor[i], neighbor[j] = neighbor[j], neighbor[i]
+        else:
+            neighbor.insert(j, neighbor.pop(i))
+        return neighbor
+
+    @staticmethod
+    def _moved_jobs(sequence: List[int], move: Move) -> Tuple[int, ...]:
+        """Jobs the move repositions: both for a swap, the inserted one for an insert."""
+        kind, i, j = move
+        if kind == 'swap':
+            return sequence[i], sequence[j]
+        return (sequence[i],)
@@ -0,0 +1,37 @@
+import random
+from src.core.generator import generate_random_instance
+from src.core.loader import load_problem
+from src.solvers.branch_and_bound import BranchAndBoundSolver
+from src.solvers.bruteforce import BruteForceSolver
+from src.solvers.subset_dp import SubsetDPSolver
+
+
+def test_exact_solvers_match_bruteforce():
+    for seed in range(15):
+        random.seed(seed)
+        problem = load_problem(generate_random_instance(max_jobs=7, max_machines=3, max_resources=3))
+        optimum = BruteForceSolver(problem).solve().makespan
+        for cls in (BranchAndBoundSolver, SubsetDPSolver):
+            solver = cls(problem)
+            solution = solver.solve()
+            assert problem.validate_solution(solution)
+            assert solver.optimal
+            assert solution.makespan == optimum
+
+
+def test_subset_dp_fallback_keeps_the_dp_incumbent():
+    fallbacks = 0
+    for seed in range(15):
+        random.seed(seed)
+        problem = load_problem(generate_random_instance(max_jobs=7, max_machines=3, max_resources=3))
+        optimum = BruteForceSolver(problem).solve().makespan
+        reported = []
+        solver = SubsetDPSolver(problem, max_states=3, on_improvement=lambda s, _: reported.append(s.makespan))
+        solution = solver.solve()
+        assert solution.makespan == optimum
+        assert solver.optimal
+        # The fallback starts from the DP's best, so it only reports improvements on it
+        assert reported == sorted(reported, reverse=True)
+        assert len(set(reported)) == len(reported)
+        fallbacks += solver.fallback
+    assert fallbacks
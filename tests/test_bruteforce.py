@@ -0,0 +1,23 @@
+import random
+from src.core.generator import generate_random_instance
+from src.core.loader import load_problem
+from src.solvers.bruteforce import BruteForceSolver
+
+
+def _instances(count, max_jobs=7):
+    for seed in range(count):
+        random.seed(seed)
+        yield load_problem(generate_random_instance(max_jobs=max_jobs, max_machines=3, max_resources=3))
+
+
+def test_sharded_matches_serial_optimum():
+    for problem in _instances(12):
+        serial = BruteForceSolver(problem)
+        expected = serial.solve().makespan
+        assert serial.best_makespan == expected
+        for workers in (2, 3):
+            solver = BruteForceSolver(problem, workers=workers)
+            sharded = solver.solve()
+            assert problem.validate_solution(sharded)
+            assert sharded.makespan == expected == solver.best_makespan
+            assert solver.stop_reason == serial.stop_reason
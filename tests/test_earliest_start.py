@@ -0,0 +1,39 @@
+import random
+from src.core.generator import generate_random_instance
+from src.core.loader import load_problem
+from src.core.resource_profile import ResourceProfile
+from src.solvers.earliest_start_solver import EarliestStartSolver
+
+
+def _rescan_schedule(problem):
+    """Reference: every step rescans every unassigned job on every machine."""
+    compiled = problem.compiled
+    free_at = [0] * problem.num_machines
+    profile = ResourceProfile(compiled.capacity_list)
+    unassigned = list(range(compiled.num_jobs))
+    schedule = {}
+    while unassigned:
+        start, j, m = min((profile.earliest_start(free_at[m], compiled.duration_list[j],
+                                                  compiled.requirement_pairs[j]), j, m)
+                          for j in unassigned for m in range(len(free_at)))
+        finish = start + compiled.duration_list[j]
+        profile.reserve(start, finish, compiled.requirement_pairs[j])
+        free_at[m] = finish
+        unassigned.remove(j)
+        schedule[compiled.job_ids[j]] = (start, m + 1)
+    return schedule
+
+
+def test_matches_full_rescan():
+    for seed in range(40):
+        random.seed(seed)
+        data = generate_random_instance(max_jobs=25, max_machines=4, max_resources=3)
+        if seed % 4 == 0:
+            for job in data['jobs'][::3]:
+                job['duration'] = 0
+        problem = load_problem(data)
+        solution = EarliestStartSolver(problem).solve()
+        assert problem.validate_solution(solution)
+        expected = _rescan_schedule(problem)
+        assert {job.id: (job.start_time, job.assigned_machine) for job in solution.jobs} == expected
+        assert solution.makespan == max(expected[job.id][0] + job.duration for job in problem.jobs)
@@ -0,0 +1,32 @@
+import random
+from src.core.generator import generate_random_instance
+from src.core.loader import load_problem
+from src.solvers.metaheuristic import GeneticSolver
+
+
+def _instance(seed):
+    random.seed(seed)
+    return load_problem(generate_random_instance(max_jobs=30, max_machines=4, max_resources=3))
+
+
+def _run(problem, seed, **params):
+    random.seed(seed)
+    solver = GeneticSolver(problem, pop_size=20, generations=15, **params)
+    solution = solver.solve()
+    return solution.makespan, solver.history, solver.history_avg
+
+
+def test_pool_evaluation_matches_serial():
+    for seed in (4, 5, 9):  # Instances where the lower bound does not end the run early
+        problem = _instance(seed)
+        serial = _run(problem, seed)
+        assert len(serial[1]) > 5
+        assert _run(problem, seed, workers=2) == serial
+
+
+def test_islands_with_zero_generations():
+    problem = _instance(4)
+    assert GeneticSolver(problem, generations=0).solve() is None
+    solver = GeneticSolver(problem, generations=0, islands=2)
+    assert solver.solve() is None
+    assert solver.history == []
@@ -0,0 +1,42 @@
+import random
+from src.core.generator import generate_random_instance
+from src.core.justification import justify
+from src.core.loader import load_problem
+from src.solvers.greedy import GreedySolver
+
+
+def _instance(seed):
+    random.seed(seed)
+    return load_problem(generate_random_instance(max_jobs=20, max_machines=3, max_resources=3))
+
+
+def test_justify_never_worsens():
+    for seed in range(20):
+        problem = _instance(seed)
+        solution = GreedySolver(problem).solve()
+        justified = justify(problem, solution)
+        assert problem.validate_solution(justified)
+        assert justified.makespan <= solution.makespan
+
+
+def test_solver_stops_on_the_justified_makespan():
+    random.seed(172)  # Greedy leaves a gap that justification closes, above the lower bound
+    problem = load_problem(generate_random_instance(max_jobs=40, max_machines=4, max_resources=3))
+    plain = GreedySolver(problem)
+    plain_solution = plain.solve()
+    expected = justify(problem, plain_solution).makespan
+    assert plain.lower_bound < expected < plain_solution.makespan
+    unjustified = GreedySolver(problem, target_makespan=expected)
+    unjustified.solve()
+    assert unjustified.stop_reason is None
+
+    reported = []
+    solver = GreedySolver(problem, justify=True, target_makespan=expected,
+                          on_improvement=lambda solution, elapsed: reported.append(solution.makespan))
+    solution = solver.solve()
+    # Callbacks and stop checks see the justified makespans
+    assert solver.stop_reason == 'target'
+    assert reported[-1] <= expected
+    assert reported == sorted(set(reported), reverse=True)
+    assert solution.makespan == reported[-1]
+    assert problem.validate_solution(solution)
@@ -0,0 +1,65 @@
+import random
+import numpy as np
+from src.core.generator import generate_random_instance
+from src.core.loader import load_problem
+from src.core.scheduler import SolutionBuilder
+
+
+def _instances(count, max_jobs=15):
+    for seed in range(count):
+        random.seed(seed)
+        yield load_problem(generate_random_instance(max_jobs=max_jobs, max_machines=4, max_resources=3))
+
+
+def _schedule(solution):
+    return [(job.id, job.start_time, job.assigned_machine) for job in solution.jobs]
+
+
+def test_evaluate_makespan_reuses_prefix_exactly():
+    rng = random.Random(0)
+    for problem in _instances(10):
+        n = len(problem.jobs)
+        for mode in SolutionBuilder.MACHINE_MODES:
+            builder = SolutionBuilder(problem, machine_mode=mode, checkpoint_interval=3)
+            sequence = list(range(n))
+            for _ in range(30):
+                i, j = rng.randrange(n), rng.randrange(n)
+                sequence[i], sequence[j] = sequence[j], sequence[i]
+                expected = SolutionBuilder(problem, machine_mode=mode).build_from_indices(sequence)
+                assert builder.evaluate_makespan(sequence) == expected.makespan
+                assert _schedule(builder.to_solution()) == _schedule(expected)
+
+
+def test_rebuild_from_and_revert():
+    rng = random.Random(1)
+    for problem in _instances(10):
+        jobs = problem.jobs
+        n = len(jobs)
+        builder = SolutionBuilder(problem, checkpoint_interval=2)
+        sequence = list(range(n))
+        rng.shuffle(sequence)
+        original = _schedule(builder.build_from_indices(sequence))
+        for _ in range(20):
+            position = rng.randrange(n + 1)
+            suffix = sequence[position:]
+            rng.shuffle(suffix)
+            rebuilt = builder.rebuild_from(position, [jobs[idx] for idx in suffix])
+            fresh = SolutionBuilder(problem).build_from_indices(sequence[:position] + suffix)
+            assert _schedule(rebuilt) == _schedule(fresh)
+            assert rebuilt.makespan == fresh.makespan
+            builder.revert()
+            assert _schedule(builder.to_solution()) == original
+
+
+def test_evaluate_batch_matches_serial_decodes():
+    rng = np.random.default_rng(2)
+    for problem in _instances(10):
+        n = len(problem.jobs)
+        perms = np.array([rng.permutation(n) for _ in range(12)])
+        for mode in SolutionBuilder.MACHINE_MODES:
+            builder = SolutionBuilder(problem, machine_mode=mode)
+            expected = [SolutionBuilder(problem, machine_mode=mode).evaluate_makespan(row) for row in perms.tolist()]
+            assert builder.evaluate_batch(perms).tolist() == expected
+            # Row-by-row fallback for long horizons
+            builder.BATCH_MAX_HORIZON = 0
+            assert builder.evaluate_batch(perms).tolist() == expected
@@ -0,0 +1,20 @@
+from src.core.model import Job, ProblemInstance, Solution
+
+
+def _solution(*placements):
+    jobs = [Job(job_id, duration, {}, start_time=start, assigned_machine=machine)
+            for job_id, duration, start, machine in placements]
+    return Solution(jobs=jobs, makespan=max(job.start_time + job.duration for job in jobs))
+
+
+def test_zero_length_job_is_no_machine_overlap():
+    problem = ProblemInstance(1, {}, [Job(1, 5, {}), Job(2, 0, {}), Job(3, 0, {})])
+    for order in ([(1, 5, 0, 1), (2, 0, 0, 1), (3, 0, 3, 1)], [(2, 0, 0, 1), (3, 0, 3, 1), (1, 5, 0, 1)]):
+        report = problem.validate_solution(_solution(*order))
+        assert report, str(report)
+
+
+def test_machine_overlap_is_reported():
+    problem = ProblemInstance(1, {}, [Job(1, 5, {}), Job(2, 3, {})])
+    report = problem.validate_solution(_solution((1, 5, 0, 1), (2, 3, 4, 1)))
+    assert [violation.kind for violation in report.violations] == ['machine_overlap']